@@ -1,5 +1,6 @@
 // src/lib/api.ts
 import { GrpcWebFetchTransport } from '@protobuf-ts/grpcweb-transport';
+import type { RpcOptions } from '@protobuf-ts/runtime-rpc';
 import { AidsServiceClient } from './protos/aids.client';
 import {
 	Chunk,
@@ -23,23 +24,28 @@ const transport = new GrpcWebFetchTransport({
 // Instantiate the gRPC client
 export const aidsClient = new AidsServiceClient(transport);
 
+// Options for calls about a dataset, envoy uses the header to always send it to the same backend
+export function datasetOptions(id: bigint): RpcOptions {
+	return { meta: { 'x-dataset-id': id.toString() } };
+}
+
 // Function to delete a dataset
 export async function deleteDataset(id: bigint): Promise<void> {
 	const request = DatasetRequest.create({ id });
-	await aidsClient.deleteDataset(request);
+	await aidsClient.deleteDataset(request, datasetOptions(id));
 }
 
 // Function to download a dataset
 export async function downloadDataset(id: bigint): Promise<Chunk> {
 	const request = DatasetRequest.create({ id });
-	const call = aidsClient.downloadDataset(request);
+	const call = aidsClient.downloadDataset(request, datasetOptions(id));
 	const response = await call.response;
 	return response;
 }
 
 export async function getChart(id: bigint, xAxis: string, yAxis: string): Promise<ChartResponse> {
 	const request = ChartRequest.create({ id, xAxis, yAxis });
-	const call = aidsClient.getChart(request);
+	const call = aidsClient.getChart(request, datasetOptions(id));
 	const response = await call.response;
 	return response;
 }
@@ -4,6 +4,10 @@
 import type { RpcTransport } from "@protobuf-ts/runtime-rpc";
 import type { ServiceInfo } from "@protobuf-ts/runtime-rpc";
 import { AidsService } from "./aids";
+import type { DistributionResponse } from "./aids";
+import type { DistributionRequest } from "./aids";
+import type { PreviewResponse } from "./aids";
+import type { PreviewRequest } from "./aids";
 import type { ChartResponse } from "./aids";
 import type { ChartRequest } from "./aids";
 import type { DatasetListResponse } from "./aids";
@@ -57,6 +61,18 @@ export interface IAidsServiceClient {
      * @generated from protobuf rpc: GetChart
      */
     getChart(input: ChartRequest, options?: RpcOptions): UnaryCall<ChartRequest, ChartResponse>;
+    /**
+     * For getting a page or a sample of the rows of a dataset without downloading it
+     *
+     * @generated from protobuf rpc: PreviewDataset
+     */
+    previewDataset(input: PreviewRequest, options?: RpcOptions): UnaryCall<PreviewRequest, PreviewResponse>;
+    /**
+     * For getting the histogram and KDE of a numeric column
+     *
+     * @generated from protobuf rpc: GetDistribution
+     */
+    getDistribution(input: DistributionRequest, options?: RpcOptions): UnaryCall<DistributionRequest, DistributionResponse>;
 }
 /**
  * Servicio gRPC para el análisis de datos
@@ -123,4 +139,22 @@ export class AidsServiceClient implements IAidsServiceClient, ServiceInfo {
         const method = this.methods[5], opt = this._transport.mergeOptions(options);
         return stackIntercept<ChartRequest, ChartResponse>("unary", this._transport, method, opt, input);
     }
+    /**
+     * For getting a page or a sample of the rows of a dataset without downloading it
+     *
+     * @generated from protobuf rpc: PreviewDataset
+     */
+    previewDataset(input: PreviewRequest, options?: RpcOptions): UnaryCall<PreviewRequest, PreviewResponse> {
+        const method = this.methods[6], opt = this._transport.mergeOptions(options);
+        return stackIntercept<PreviewRequest, PreviewResponse>("unary", this._transport, method, opt, input);
+    }
+    /**
+     * For getting the histogram and KDE of a numeric column
+     *
+     * @generated from protobuf rpc: GetDistribution
+     */
+    getDistribution(input: DistributionRequest, options?: RpcOptions): UnaryCall<DistributionRequest, DistributionResponse> {
+        const method = this.methods[7], opt = this._transport.mergeOptions(options);
+        return stackIntercept<DistributionRequest, DistributionResponse>("unary", this._transport, method, opt, input);
+    }
 }
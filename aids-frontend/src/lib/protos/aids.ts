@@ -112,9 +112,25 @@ export interface ChartRequest {
      * @generated from protobuf field: string y_axis = 3
      */
     yAxis: string; // name of CSV column for y axis
+    /**
+     * @generated from protobuf field: ChartFormat format = 4
+     */
+    format: ChartFormat; // output format, SVG if not set
+    /**
+     * @generated from protobuf field: int32 dpi = 5
+     */
+    dpi: number; // dots per inch, 0 for the default (100)
+    /**
+     * @generated from protobuf field: int32 width = 6
+     */
+    width: number; // width in pixels, 0 for the default (640)
+    /**
+     * @generated from protobuf field: int32 height = 7
+     */
+    height: number; // height in pixels, 0 for the default (480)
 }
 /**
- * response with an SVG string fo the server
+ * response with the chart generated by the server
  *
  * @generated from protobuf message ChartResponse
  */
@@ -122,7 +138,144 @@ export interface ChartResponse {
     /**
      * @generated from protobuf field: string svg = 1
      */
-    svg: string; // SVG string of the generated graph
+    svg: string; // SVG string of the generated graph, only set for SVG
+    /**
+     * @generated from protobuf field: bytes image = 2
+     */
+    image: Uint8Array; // encoded image, only set for PNG and WEBP
+    /**
+     * @generated from protobuf field: ChartFormat format = 3
+     */
+    format: ChartFormat; // format of the chart
+}
+/**
+ * request for a page or a random sample of the rows of a dataset
+ *
+ * @generated from protobuf message PreviewRequest
+ */
+export interface PreviewRequest {
+    /**
+     * @generated from protobuf field: int64 id = 1
+     */
+    id: bigint; // dataset id
+    /**
+     * @generated from protobuf field: int64 offset = 2
+     */
+    offset: bigint; // first row of the page (0 is the first row after the header)
+    /**
+     * @generated from protobuf field: int32 limit = 3
+     */
+    limit: number; // number of rows of the page, 0 for the default (100)
+    /**
+     * @generated from protobuf field: int32 sample_size = 4
+     */
+    sampleSize: number; // if > 0, returns this many random rows instead of a page
+    /**
+     * @generated from protobuf field: int64 seed = 5
+     */
+    seed: bigint; // seed for the sample, the same seed always returns the same rows
+}
+/**
+ * response with the requested rows
+ *
+ * @generated from protobuf message PreviewResponse
+ */
+export interface PreviewResponse {
+    /**
+     * @generated from protobuf field: string rows_data = 1
+     */
+    rowsData: string; // rows in JSON, pandas to_json(orient="split"). index is the row number
+    /**
+     * @generated from protobuf field: int64 total_rows = 2
+     */
+    totalRows: bigint; // number of rows in the dataset
+}
+/**
+ * request for the distribution of a numeric column
+ *
+ * @generated from protobuf message DistributionRequest
+ */
+export interface DistributionRequest {
+    /**
+     * @generated from protobuf field: int64 id = 1
+     */
+    id: bigint; // dataset id
+    /**
+     * @generated from protobuf field: string column = 2
+     */
+    column: string; // name of the CSV column
+    /**
+     * @generated from protobuf field: int32 bins = 3
+     */
+    bins: number; // number of bins of the histogram, 0 for the default (30)
+    /**
+     * @generated from protobuf field: bool include_chart = 4
+     */
+    includeChart: boolean; // also render the histogram and the KDE as a chart
+    /**
+     * @generated from protobuf field: ChartFormat format = 5
+     */
+    format: ChartFormat; // output format of the chart, SVG if not set
+    /**
+     * @generated from protobuf field: int32 dpi = 6
+     */
+    dpi: number; // dots per inch of the chart, 0 for the default (100)
+    /**
+     * @generated from protobuf field: int32 width = 7
+     */
+    width: number; // width of the chart in pixels, 0 for the default (640)
+    /**
+     * @generated from protobuf field: int32 height = 8
+     */
+    height: number; // height of the chart in pixels, 0 for the default (480)
+}
+/**
+ * response with the histogram and KDE of a column, for rendering on the client
+ *
+ * @generated from protobuf message DistributionResponse
+ */
+export interface DistributionResponse {
+    /**
+     * @generated from protobuf field: repeated double bin_edges = 1
+     */
+    binEdges: number[]; // edges of the bins, one more than counts
+    /**
+     * @generated from protobuf field: repeated int64 counts = 2
+     */
+    counts: bigint[]; // number of values in each bin
+    /**
+     * @generated from protobuf field: repeated double kde_x = 3
+     */
+    kdeX: number[]; // points where the KDE was evaluated
+    /**
+     * @generated from protobuf field: repeated double kde_y = 4
+     */
+    kdeY: number[]; // density of the KDE at each point
+    /**
+     * @generated from protobuf field: ChartResponse chart = 5
+     */
+    chart?: ChartResponse; // rendered chart, only set if include_chart
+}
+/**
+ * output format of a chart
+ *
+ * @generated from protobuf enum ChartFormat
+ */
+export enum ChartFormat {
+    /**
+     * vector, size grows with the number of points
+     *
+     * @generated from protobuf enum value: SVG = 0;
+     */
+    SVG = 0,
+    /**
+     * @generated from protobuf enum value: PNG = 1;
+     */
+    PNG = 1,
+    /**
+     * @generated from protobuf enum value: WEBP = 2;
+     */
+    WEBP = 2
 }
 // @generated message type with reflection information, may provide speed optimized methods
 class Chunk$Type extends MessageType<Chunk> {
@@ -444,7 +597,11 @@ class ChartRequest$Type extends MessageType<ChartRequest> {
         super("ChartRequest", [
             { no: 1, name: "id", kind: "scalar", T: 3 /*ScalarType.INT64*/, L: 0 /*LongType.BIGINT*/ },
             { no: 2, name: "x_axis", kind: "scalar", T: 9 /*ScalarType.STRING*/ },
-            { no: 3, name: "y_axis", kind: "scalar", T: 9 /*ScalarType.STRING*/ }
+            { no: 3, name: "y_axis", kind: "scalar", T: 9 /*ScalarType.STRING*/ },
+            { no: 4, name: "format", kind: "enum", T: () => ["ChartFormat", ChartFormat] },
+            { no: 5, name: "dpi", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
+            { no: 6, name: "width", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
+            { no: 7, name: "height", kind: "scalar", T: 5 /*ScalarType.INT32*/ }
         ]);
     }
     create(value?: PartialMessage<ChartRequest>): ChartRequest {
@@ -452,6 +609,10 @@ class ChartRequest$Type extends MessageType<ChartRequest> {
         message.id = 0n;
         message.xAxis = "";
         message.yAxis = "";
+        message.format = 0;
+        message.dpi = 0;
+        message.width = 0;
+        message.height = 0;
         if (value !== undefined)
             reflectionMergePartial<ChartRequest>(this, message, value);
         return message;
@@ -470,6 +631,18 @@ class ChartRequest$Type extends MessageType<ChartRequest> {
                 case /* string y_axis */ 3:
                     message.yAxis = reader.string();
                     break;
+                case /* ChartFormat format */ 4:
+                    message.format = reader.int32();
+                    break;
+                case /* int32 dpi */ 5:
+                    message.dpi = reader.int32();
+                    break;
+                case /* int32 width */ 6:
+                    message.width = reader.int32();
+                    break;
+                case /* int32 height */ 7:
+                    message.height = reader.int32();
+                    break;
                 default:
                     let u = options.readUnknownField;
                     if (u === "throw")
@@ -491,6 +664,18 @@ class ChartRequest$Type extends MessageType<ChartRequest> {
         /* string y_axis = 3; */
         if (message.yAxis !== "")
             writer.tag(3, WireType.LengthDelimited).string(message.yAxis);
+        /* ChartFormat format = 4; */
+        if (message.format !== 0)
+            writer.tag(4, WireType.Varint).int32(message.format);
+        /* int32 dpi = 5; */
+        if (message.dpi !== 0)
+            writer.tag(5, WireType.Varint).int32(message.dpi);
+        /* int32 width = 6; */
+        if (message.width !== 0)
+            writer.tag(6, WireType.Varint).int32(message.width);
+        /* int32 height = 7; */
+        if (message.height !== 0)
+            writer.tag(7, WireType.Varint).int32(message.height);
         let u = options.writeUnknownFields;
         if (u !== false)
             (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
@@ -505,12 +690,16 @@ export const ChartRequest = new ChartRequest$Type();
 class ChartResponse$Type extends MessageType<ChartResponse> {
     constructor() {
         super("ChartResponse", [
-            { no: 1, name: "svg", kind: "scalar", T: 9 /*ScalarType.STRING*/ }
+            { no: 1, name: "svg", kind: "scalar", T: 9 /*ScalarType.STRING*/ },
+            { no: 2, name: "image", kind: "scalar", T: 12 /*ScalarType.BYTES*/ },
+            { no: 3, name: "format", kind: "enum", T: () => ["ChartFormat", ChartFormat] }
         ]);
     }
     create(value?: PartialMessage<ChartResponse>): ChartResponse {
         const message = globalThis.Object.create((this.messagePrototype!));
         message.svg = "";
+        message.image = new Uint8Array(0);
+        message.format = 0;
         if (value !== undefined)
             reflectionMergePartial<ChartResponse>(this, message, value);
         return message;
@@ -523,6 +712,12 @@ class ChartResponse$Type extends MessageType<ChartResponse> {
                 case /* string svg */ 1:
                     message.svg = reader.string();
                     break;
+                case /* bytes image */ 2:
+                    message.image = reader.bytes();
+                    break;
+                case /* ChartFormat format */ 3:
+                    message.format = reader.int32();
+                    break;
                 default:
                     let u = options.readUnknownField;
                     if (u === "throw")
@@ -538,6 +733,12 @@ class ChartResponse$Type extends MessageType<ChartResponse> {
         /* string svg = 1; */
         if (message.svg !== "")
             writer.tag(1, WireType.LengthDelimited).string(message.svg);
+        /* bytes image = 2; */
+        if (message.image.length)
+            writer.tag(2, WireType.LengthDelimited).bytes(message.image);
+        /* ChartFormat format = 3; */
+        if (message.format !== 0)
+            writer.tag(3, WireType.Varint).int32(message.format);
         let u = options.writeUnknownFields;
         if (u !== false)
             (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
@@ -548,6 +749,353 @@ class ChartResponse$Type extends MessageType<ChartResponse> {
  * @generated MessageType for protobuf message ChartResponse
  */
 export const ChartResponse = new ChartResponse$Type();
+// @generated message type with reflection information, may provide speed optimized methods
+class PreviewRequest$Type extends MessageType<PreviewRequest> {
+    constructor() {
+        super("PreviewRequest", [
+            { no: 1, name: "id", kind: "scalar", T: 3 /*ScalarType.INT64*/, L: 0 /*LongType.BIGINT*/ },
+            { no: 2, name: "offset", kind: "scalar", T: 3 /*ScalarType.INT64*/, L: 0 /*LongType.BIGINT*/ },
+            { no: 3, name: "limit", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
+            { no: 4, name: "sample_size", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
+            { no: 5, name: "seed", kind: "scalar", T: 3 /*ScalarType.INT64*/, L: 0 /*LongType.BIGINT*/ }
+        ]);
+    }
+    create(value?: PartialMessage<PreviewRequest>): PreviewRequest {
+        const message = globalThis.Object.create((this.messagePrototype!));
+        message.id = 0n;
+        message.offset = 0n;
+        message.limit = 0;
+        message.sampleSize = 0;
+        message.seed = 0n;
+        if (value !== undefined)
+            reflectionMergePartial<PreviewRequest>(this, message, value);
+        return message;
+    }
+    internalBinaryRead(reader: IBinaryReader, length: number, options: BinaryReadOptions, target?: PreviewRequest): PreviewRequest {
+        let message = target ?? this.create(), end = reader.pos + length;
+        while (reader.pos < end) {
+            let [fieldNo, wireType] = reader.tag();
+            switch (fieldNo) {
+                case /* int64 id */ 1:
+                    message.id = reader.int64().toBigInt();
+                    break;
+                case /* int64 offset */ 2:
+                    message.offset = reader.int64().toBigInt();
+                    break;
+                case /* int32 limit */ 3:
+                    message.limit = reader.int32();
+                    break;
+                case /* int32 sample_size */ 4:
+                    message.sampleSize = reader.int32();
+                    break;
+                case /* int64 seed */ 5:
+                    message.seed = reader.int64().toBigInt();
+                    break;
+                default:
+                    let u = options.readUnknownField;
+                    if (u === "throw")
+                        throw new globalThis.Error(`Unknown field ${fieldNo} (wire type ${wireType}) for ${this.typeName}`);
+                    let d = reader.skip(wireType);
+                    if (u !== false)
+                        (u === true ? UnknownFieldHandler.onRead : u)(this.typeName, message, fieldNo, wireType, d);
+            }
+        }
+        return message;
+    }
+    internalBinaryWrite(message: PreviewRequest, writer: IBinaryWriter, options: BinaryWriteOptions): IBinaryWriter {
+        /* int64 id = 1; */
+        if (message.id !== 0n)
+            writer.tag(1, WireType.Varint).int64(message.id);
+        /* int64 offset = 2; */
+        if (message.offset !== 0n)
+            writer.tag(2, WireType.Varint).int64(message.offset);
+        /* int32 limit = 3; */
+        if (message.limit !== 0)
+            writer.tag(3, WireType.Varint).int32(message.limit);
+        /* int32 sample_size = 4; */
+        if (message.sampleSize !== 0)
+            writer.tag(4, WireType.Varint).int32(message.sampleSize);
+        /* int64 seed = 5; */
+        if (message.seed !== 0n)
+            writer.tag(5, WireType.Varint).int64(message.seed);
+        let u = options.writeUnknownFields;
+        if (u !== false)
+            (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
+        return writer;
+    }
+}
+/**
+ * @generated MessageType for protobuf message PreviewRequest
+ */
+export const PreviewRequest = new PreviewRequest$Type();
+// @generated message type with reflection information, may provide speed optimized methods
+class PreviewResponse$Type extends MessageType<PreviewResponse> {
+    constructor() {
+        super("PreviewResponse", [
+            { no: 1, name: "rows_data", kind: "scalar", T: 9 /*ScalarType.STRING*/ },
+            { no: 2, name: "total_rows", kind: "scalar", T: 3 /*ScalarType.INT64*/, L: 0 /*LongType.BIGINT*/ }
+        ]);
+    }
+    create(value?: PartialMessage<PreviewResponse>): PreviewResponse {
+        const message = globalThis.Object.create((this.messagePrototype!));
+        message.rowsData = "";
+        message.totalRows = 0n;
+        if (value !== undefined)
+            reflectionMergePartial<PreviewResponse>(this, message, value);
+        return message;
+    }
+    internalBinaryRead(reader: IBinaryReader, length: number, options: BinaryReadOptions, target?: PreviewResponse): PreviewResponse {
+        let message = target ?? this.create(), end = reader.pos + length;
+        while (reader.pos < end) {
+            let [fieldNo, wireType] = reader.tag();
+            switch (fieldNo) {
+                case /* string rows_data */ 1:
+                    message.rowsData = reader.string();
+                    break;
+                case /* int64 total_rows */ 2:
+                    message.totalRows = reader.int64().toBigInt();
+                    break;
+                default:
+                    let u = options.readUnknownField;
+                    if (u === "throw")
+                        throw new globalThis.Error(`Unknown field ${fieldNo} (wire type ${wireType}) for ${this.typeName}`);
+                    let d = reader.skip(wireType);
+                    if (u !== false)
+                        (u === true ? UnknownFieldHandler.onRead : u)(this.typeName, message, fieldNo, wireType, d);
+            }
+        }
+        return message;
+    }
+    internalBinaryWrite(message: PreviewResponse, writer: IBinaryWriter, options: BinaryWriteOptions): IBinaryWriter {
+        /* string rows_data = 1; */
+        if (message.rowsData !== "")
+            writer.tag(1, WireType.LengthDelimited).string(message.rowsData);
+        /* int64 total_rows = 2; */
+        if (message.totalRows !== 0n)
+            writer.tag(2, WireType.Varint).int64(message.totalRows);
+        let u = options.writeUnknownFields;
+        if (u !== false)
+            (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
+        return writer;
+    }
+}
+/**
+ * @generated MessageType for protobuf message PreviewResponse
+ */
+export const PreviewResponse = new PreviewResponse$Type();
+// @generated message type with reflection information, may provide speed optimized methods
+class DistributionRequest$Type extends MessageType<DistributionRequest> {
+    constructor() {
+        super("DistributionRequest", [
+            { no: 1, name: "id", kind: "scalar", T: 3 /*ScalarType.INT64*/, L: 0 /*LongType.BIGINT*/ },
+            { no: 2, name: "column", kind: "scalar", T: 9 /*ScalarType.STRING*/ },
+            { no: 3, name: "bins", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
+            { no: 4, name: "include_chart", kind: "scalar", T: 8 /*ScalarType.BOOL*/ },
+            { no: 5, name: "format", kind: "enum", T: () => ["ChartFormat", ChartFormat] },
+            { no: 6, name: "dpi", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
+            { no: 7, name: "width", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
+            { no: 8, name: "height", kind: "scalar", T: 5 /*ScalarType.INT32*/ }
+        ]);
+    }
+    create(value?: PartialMessage<DistributionRequest>): DistributionRequest {
+        const message = globalThis.Object.create((this.messagePrototype!));
+        message.id = 0n;
+        message.column = "";
+        message.bins = 0;
+        message.includeChart = false;
+        message.format = 0;
+        message.dpi = 0;
+        message.width = 0;
+        message.height = 0;
+        if (value !== undefined)
+            reflectionMergePartial<DistributionRequest>(this, message, value);
+        return message;
+    }
+    internalBinaryRead(reader: IBinaryReader, length: number, options: BinaryReadOptions, target?: DistributionRequest): DistributionRequest {
+        let message = target ?? this.create(), end = reader.pos + length;
+        while (reader.pos < end) {
+            let [fieldNo, wireType] = reader.tag();
+            switch (fieldNo) {
+                case /* int64 id */ 1:
+                    message.id = reader.int64().toBigInt();
+                    break;
+                case /* string column */ 2:
+                    message.column = reader.string();
+                    break;
+                case /* int32 bins */ 3:
+                    message.bins = reader.int32();
+                    break;
+                case /* bool include_chart */ 4:
+                    message.includeChart = reader.bool();
+                    break;
+                case /* ChartFormat format */ 5:
+                    message.format = reader.int32();
+                    break;
+                case /* int32 dpi */ 6:
+                    message.dpi = reader.int32();
+                    break;
+                case /* int32 width */ 7:
+                    message.width = reader.int32();
+                    break;
+                case /* int32 height */ 8:
+                    message.height = reader.int32();
+                    break;
+                default:
+                    let u = options.readUnknownField;
+                    if (u === "throw")
+                        throw new globalThis.Error(`Unknown field ${fieldNo} (wire type ${wireType}) for ${this.typeName}`);
+                    let d = reader.skip(wireType);
+                    if (u !== false)
+                        (u === true ? UnknownFieldHandler.onRead : u)(this.typeName, message, fieldNo, wireType, d);
+            }
+        }
+        return message;
+    }
+    internalBinaryWrite(message: DistributionRequest, writer: IBinaryWriter, options: BinaryWriteOptions): IBinaryWriter {
+        /* int64 id = 1; */
+        if (message.id !== 0n)
+            writer.tag(1, WireType.Varint).int64(message.id);
+        /* string column = 2; */
+        if (message.column !== "")
+            writer.tag(2, WireType.LengthDelimited).string(message.column);
+        /* int32 bins = 3; */
+        if (message.bins !== 0)
+            writer.tag(3, WireType.Varint).int32(message.bins);
+        /* bool include_chart = 4; */
+        if (message.includeChart !== false)
+            writer.tag(4, WireType.Varint).bool(message.includeChart);
+        /* ChartFormat format = 5; */
+        if (message.format !== 0)
+            writer.tag(5, WireType.Varint).int32(message.format);
+        /* int32 dpi = 6; */
+        if (message.dpi !== 0)
+            writer.tag(6, WireType.Varint).int32(message.dpi);
+        /* int32 width = 7; */
+        if (message.width !== 0)
+            writer.tag(7, WireType.Varint).int32(message.width);
+        /* int32 height = 8; */
+        if (message.height !== 0)
+            writer.tag(8, WireType.Varint).int32(message.height);
+        let u = options.writeUnknownFields;
+        if (u !== false)
+            (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
+        return writer;
+    }
+}
+/**
+ * @generated MessageType for protobuf message DistributionRequest
+ */
+export const DistributionRequest = new DistributionRequest$Type();
+// @generated message type with reflection information, may provide speed optimized methods
+class DistributionResponse$Type extends MessageType<DistributionResponse> {
+    constructor() {
+        super("DistributionResponse", [
+            { no: 1, name: "bin_edges", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 1 /*ScalarType.DOUBLE*/ },
+            { no: 2, name: "counts", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 3 /*ScalarType.INT64*/, L: 0 /*LongType.BIGINT*/ },
+            { no: 3, name: "kde_x", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 1 /*ScalarType.DOUBLE*/ },
+            { no: 4, name: "kde_y", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 1 /*ScalarType.DOUBLE*/ },
+            { no: 5, name: "chart", kind: "message", T: () => ChartResponse }
+        ]);
+    }
+    create(value?: PartialMessage<DistributionResponse>): DistributionResponse {
+        const message = globalThis.Object.create((this.messagePrototype!));
+        message.binEdges = [];
+        message.counts = [];
+        message.kdeX = [];
+        message.kdeY = [];
+        if (value !== undefined)
+            reflectionMergePartial<DistributionResponse>(this, message, value);
+        return message;
+    }
+    internalBinaryRead(reader: IBinaryReader, length: number, options: BinaryReadOptions, target?: DistributionResponse): DistributionResponse {
+        let message = target ?? this.create(), end = reader.pos + length;
+        while (reader.pos < end) {
+            let [fieldNo, wireType] = reader.tag();
+            switch (fieldNo) {
+                case /* repeated double bin_edges */ 1:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.binEdges.push(reader.double());
+                    else
+                        message.binEdges.push(reader.double());
+                    break;
+                case /* repeated int64 counts */ 2:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.counts.push(reader.int64().toBigInt());
+                    else
+                        message.counts.push(reader.int64().toBigInt());
+                    break;
+                case /* repeated double kde_x */ 3:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.kdeX.push(reader.double());
+                    else
+                        message.kdeX.push(reader.double());
+                    break;
+                case /* repeated double kde_y */ 4:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.kdeY.push(reader.double());
+                    else
+                        message.kdeY.push(reader.double());
+                    break;
+                case /* ChartResponse chart */ 5:
+                    message.chart = ChartResponse.internalBinaryRead(reader, reader.uint32(), options, message.chart);
+                    break;
+                default:
+                    let u = options.readUnknownField;
+                    if (u === "throw")
+                        throw new globalThis.Error(`Unknown field ${fieldNo} (wire type ${wireType}) for ${this.typeName}`);
+                    let d = reader.skip(wireType);
+                    if (u !== false)
+                        (u === true ? UnknownFieldHandler.onRead : u)(this.typeName, message, fieldNo, wireType, d);
+            }
+        }
+        return message;
+    }
+    internalBinaryWrite(message: DistributionResponse, writer: IBinaryWriter, options: BinaryWriteOptions): IBinaryWriter {
+        /* repeated double bin_edges = 1; */
+        if (message.binEdges.length) {
+            writer.tag(1, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.binEdges.length; i++)
+                writer.double(message.binEdges[i]);
+            writer.join();
+        }
+        /* repeated int64 counts = 2; */
+        if (message.counts.length) {
+            writer.tag(2, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.counts.length; i++)
+                writer.int64(message.counts[i]);
+            writer.join();
+        }
+        /* repeated double kde_x = 3; */
+        if (message.kdeX.length) {
+            writer.tag(3, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.kdeX.length; i++)
+                writer.double(message.kdeX[i]);
+            writer.join();
+        }
+        /* repeated double kde_y = 4; */
+        if (message.kdeY.length) {
+            writer.tag(4, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.kdeY.length; i++)
+                writer.double(message.kdeY[i]);
+            writer.join();
+        }
+        /* ChartResponse chart = 5; */
+        if (message.chart)
+            ChartResponse.internalBinaryWrite(message.chart, writer.tag(5, WireType.LengthDelimited).fork(), options).join();
+        let u = options.writeUnknownFields;
+        if (u !== false)
+            (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
+        return writer;
+    }
+}
+/**
+ * @generated MessageType for protobuf message DistributionResponse
+ */
+export const DistributionResponse = new DistributionResponse$Type();
 /**
  * @generated ServiceType for protobuf service AidsService
  */
@@ -557,5 +1105,7 @@ export const AidsService = new ServiceType("AidsService", [
     { name: "ListSavedDatasets", options: {}, I: Empty, O: DatasetListResponse },
     { name: "DeleteDataset", options: {}, I: DatasetRequest, O: Empty },
     { name: "DownloadDataset", options: {}, I: DatasetRequest, O: Chunk },
-    { name: "GetChart", options: {}, I: ChartRequest, O: ChartResponse }
+    { name: "GetChart", options: {}, I: ChartRequest, O: ChartResponse },
+    { name: "PreviewDataset", options: {}, I: PreviewRequest, O: PreviewResponse },
+    { name: "GetDistribution", options: {}, I: DistributionRequest, O: DistributionResponse }
 ]);
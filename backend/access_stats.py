@@ -0,0 +1,75 @@
+import datetime
+import logging
+import os
+import threading
+
+from database_handler import DatabaseHandler
+
+# seconds between writes of the usage statistics to the database
+ACCESS_FLUSH_SECONDS = int(os.environ.get("AIDS_ACCESS_FLUSH_SECONDS", "30"))
+
+
+class AccessStats:
+    """
+    Counts the accesses to each dataset in memory and writes them to the database every
+    flush_seconds, so requests never wait for (or fail because of) the usage statistics.
+    The counts of the last flush_seconds are lost if the server dies.
+    """
+
+    def __init__(
+        self, db_handler: DatabaseHandler, flush_seconds: int = ACCESS_FLUSH_SECONDS
+    ) -> None:
+        self.db_handler: DatabaseHandler = db_handler
+        self.flush_seconds: int = flush_seconds
+        self._pending: dict[int, tuple[int, datetime.datetime]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: threading.Event = threading.Event()
+
+    def record(self, dataset_id: int):
+        """
+        Counts one access to a dataset.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        with self._lock:
+            count, _ = self._pending.get(dataset_id, (0, now))
+            self._pending[dataset_id] = (count + 1, now)
+
+    def flush(self):
+        """
+        Writes the pending accesses to the database. If it fails they're kept for the next flush.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            self.db_handler.record_accesses(pending)
+        except Exception as e:
+            logging.error(f"Failed to save the usage statistics: {e}")
+            with self._lock:
+                for dataset_id, (count, last_access) in pending.items():
+                    newer_count, newer_access = self._pending.get(
+                        dataset_id, (0, last_access)
+                    )
+                    self._pending[dataset_id] = (count + newer_count, newer_access)
+
+    def start(self) -> threading.Thread:
+        """
+        Starts the background thread that flushes every flush_seconds, until stop is called.
+        """
+
+        def run() -> None:
+            while not self._stopped.wait(self.flush_seconds):
+                self.flush()
+
+        thread = threading.Thread(target=run, name="access-stats", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        """
+        Stops the background thread and writes what is still pending.
+        """
+        self._stopped.set()
+        self.flush()
@@ -25,13 +25,15 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\naids.proto\x1a\x1bgoogle/protobuf/empty.proto\"+\n\x05\x43hunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"-\n\x0eUploadResponse\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1c\n\x0e\x44\x61tasetRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\'\n\x0fSummaryResponse\x12\x14\n\x0csummary_data\x18\x01 \x01(\t\";\n\x0b\x44\x61tasetInfo\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\t\"5\n\x13\x44\x61tasetListResponse\x12\x1e\n\x08\x64\x61tasets\x18\x01 \x03(\x0b\x32\x0c.DatasetInfo\":\n\x0c\x43hartRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0e\n\x06x_axis\x18\x02 \x01(\t\x12\x0e\n\x06y_axis\x18\x03 \x01(\t\"\x1c\n\rChartResponse\x12\x0b\n\x03svg\x18\x01 \x01(\t2\xbf\x02\n\x0b\x41idsService\x12$\n\tUploadCsv\x12\x06.Chunk\x1a\x0f.UploadResponse\x12\x36\n\x11GetDatasetSummary\x12\x0f.DatasetRequest\x1a\x10.SummaryResponse\x12\x41\n\x11ListSavedDatasets\x12\x16.google.protobuf.Empty\x1a\x14.DatasetListResponse\x12\x38\n\rDeleteDataset\x12\x0f.DatasetRequest\x1a\x16.google.protobuf.Empty\x12*\n\x0f\x44ownloadDataset\x12\x0f.DatasetRequest\x1a\x06.Chunk\x12)\n\x08GetChart\x12\r.ChartRequest\x1a\x0e.ChartResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\naids.proto\x1a\x1bgoogle/protobuf/empty.proto\"+\n\x05\x43hunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"-\n\x0eUploadResponse\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1c\n\x0e\x44\x61tasetRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\'\n\x0fSummaryResponse\x12\x14\n\x0csummary_data\x18\x01 \x01(\t\";\n\x0b\x44\x61tasetInfo\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\t\"5\n\x13\x44\x61tasetListResponse\x12\x1e\n\x08\x64\x61tasets\x18\x01 \x03(\x0b\x32\x0c.DatasetInfo\"\x84\x01\n\x0c\x43hartRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0e\n\x06x_axis\x18\x02 \x01(\t\x12\x0e\n\x06y_axis\x18\x03 \x01(\t\x12\x1c\n\x06\x66ormat\x18\x04 \x01(\x0e\x32\x0c.ChartFormat\x12\x0b\n\x03\x64pi\x18\x05 \x01(\x05\x12\r\n\x05width\x18\x06 \x01(\x05\x12\x0e\n\x06height\x18\x07 \x01(\x05\"I\n\rChartResponse\x12\x0b\n\x03svg\x18\x01 \x01(\t\x12\r\n\x05image\x18\x02 \x01(\x0c\x12\x1c\n\x06\x66ormat\x18\x03 \x01(\x0e\x32\x0c.ChartFormat\"^\n\x0ePreviewRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x13\n\x0bsample_size\x18\x04 \x01(\x05\x12\x0c\n\x04seed\x18\x05 \x01(\x03\"8\n\x0fPreviewResponse\x12\x11\n\trows_data\x18\x01 \x01(\t\x12\x12\n\ntotal_rows\x18\x02 \x01(\x03\"\xa0\x01\n\x13\x44istributionRequest\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0e\n\x06\x63olumn\x18\x02 \x01(\t\x12\x0c\n\x04\x62ins\x18\x03 \x01(\x05\x12\x15\n\rinclude_chart\x18\x04 \x01(\x08\x12\x1c\n\x06\x66ormat\x18\x05 \x01(\x0e\x32\x0c.ChartFormat\x12\x0b\n\x03\x64pi\x18\x06 \x01(\x05\x12\r\n\x05width\x18\x07 \x01(\x05\x12\x0e\n\x06height\x18\x08 \x01(\x05\"v\n\x14\x44istributionResponse\x12\x11\n\tbin_edges\x18\x01 \x03(\x01\x12\x0e\n\x06\x63ounts\x18\x02 \x03(\x03\x12\r\n\x05kde_x\x18\x03 \x03(\x01\x12\r\n\x05kde_y\x18\x04 \x03(\x01\x12\x1d\n\x05\x63hart\x18\x05 \x01(\x0b\x32\x0e.ChartResponse*)\n\x0b\x43hartFormat\x12\x07\n\x03SVG\x10\x00\x12\x07\n\x03PNG\x10\x01\x12\x08\n\x04WEBP\x10\x02\x32\xb4\x03\n\x0b\x41idsService\x12$\n\tUploadCsv\x12\x06.Chunk\x1a\x0f.UploadResponse\x12\x36\n\x11GetDatasetSummary\x12\x0f.DatasetRequest\x1a\x10.SummaryResponse\x12\x41\n\x11ListSavedDatasets\x12\x16.google.protobuf.Empty\x1a\x14.DatasetListResponse\x12\x38\n\rDeleteDataset\x12\x0f.DatasetRequest\x1a\x16.google.protobuf.Empty\x12*\n\x0f\x44ownloadDataset\x12\x0f.DatasetRequest\x1a\x06.Chunk\x12)\n\x08GetChart\x12\r.ChartRequest\x1a\x0e.ChartResponse\x12\x33\n\x0ePreviewDataset\x12\x0f.PreviewRequest\x1a\x10.PreviewResponse\x12>\n\x0fGetDistribution\x12\x14.DistributionRequest\x1a\x15.DistributionResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'aids_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_CHARTFORMAT']._serialized_start=969
+  _globals['_CHARTFORMAT']._serialized_end=1010
   _globals['_CHUNK']._serialized_start=43
   _globals['_CHUNK']._serialized_end=86
   _globals['_UPLOADRESPONSE']._serialized_start=88
@@ -44,10 +46,18 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DATASETINFO']._serialized_end=265
   _globals['_DATASETLISTRESPONSE']._serialized_start=267
   _globals['_DATASETLISTRESPONSE']._serialized_end=320
-  _globals['_CHARTREQUEST']._serialized_start=322
-  _globals['_CHARTREQUEST']._serialized_end=380
-  _globals['_CHARTRESPONSE']._serialized_start=382
-  _globals['_CHARTRESPONSE']._serialized_end=410
-  _globals['_AIDSSERVICE']._serialized_start=413
-  _globals['_AIDSSERVICE']._serialized_end=732
+  _globals['_CHARTREQUEST']._serialized_start=323
+  _globals['_CHARTREQUEST']._serialized_end=455
+  _globals['_CHARTRESPONSE']._serialized_start=457
+  _globals['_CHARTRESPONSE']._serialized_end=530
+  _globals['_PREVIEWREQUEST']._serialized_start=532
+  _globals['_PREVIEWREQUEST']._serialized_end=626
+  _globals['_PREVIEWRESPONSE']._serialized_start=628
+  _globals['_PREVIEWRESPONSE']._serialized_end=684
+  _globals['_DISTRIBUTIONREQUEST']._serialized_start=687
+  _globals['_DISTRIBUTIONREQUEST']._serialized_end=847
+  _globals['_DISTRIBUTIONRESPONSE']._serialized_start=849
+  _globals['_DISTRIBUTIONRESPONSE']._serialized_end=967
+  _globals['_AIDSSERVICE']._serialized_start=1013
+  _globals['_AIDSSERVICE']._serialized_end=1449
 # @@protoc_insertion_point(module_scope)
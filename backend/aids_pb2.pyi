@@ -1,5 +1,6 @@
 from google.protobuf import empty_pb2 as _empty_pb2
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from collections.abc import Iterable as _Iterable, Mapping as _Mapping
@@ -7,6 +8,15 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class ChartFormat(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SVG: _ClassVar[ChartFormat]
+    PNG: _ClassVar[ChartFormat]
+    WEBP: _ClassVar[ChartFormat]
+SVG: ChartFormat
+PNG: ChartFormat
+WEBP: ChartFormat
+
 class Chunk(_message.Message):
     __slots__ = ("content", "file_name")
     CONTENT_FIELD_NUMBER: _ClassVar[int]
@@ -52,17 +62,85 @@ class DatasetListResponse(_message.Message):
     def __init__(self, datasets: _Optional[_Iterable[_Union[DatasetInfo, _Mapping]]] = ...) -> None: ...
 
 class ChartRequest(_message.Message):
-    __slots__ = ("id", "x_axis", "y_axis")
+    __slots__ = ("id", "x_axis", "y_axis", "format", "dpi", "width", "height")
     ID_FIELD_NUMBER: _ClassVar[int]
     X_AXIS_FIELD_NUMBER: _ClassVar[int]
     Y_AXIS_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    DPI_FIELD_NUMBER: _ClassVar[int]
+    WIDTH_FIELD_NUMBER: _ClassVar[int]
+    HEIGHT_FIELD_NUMBER: _ClassVar[int]
     id: int
     x_axis: str
     y_axis: str
-    def __init__(self, id: _Optional[int] = ..., x_axis: _Optional[str] = ..., y_axis: _Optional[str] = ...) -> None: ...
+    format: ChartFormat
+    dpi: int
+    width: int
+    height: int
+    def __init__(self, id: _Optional[int] = ..., x_axis: _Optional[str] = ..., y_axis: _Optional[str] = ..., format: _Optional[_Union[ChartFormat, str]] = ..., dpi: _Optional[int] = ..., width: _Optional[int] = ..., height: _Optional[int] = ...) -> None: ...
 
 class ChartResponse(_message.Message):
-    __slots__ = ("svg",)
+    __slots__ = ("svg", "image", "format")
     SVG_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
     svg: str
-    def __init__(self, svg: _Optional[str] = ...) -> None: ...
+    image: bytes
+    format: ChartFormat
+    def __init__(self, svg: _Optional[str] = ..., image: _Optional[bytes] = ..., format: _Optional[_Union[ChartFormat, str]] = ...) -> None: ...
+
+class PreviewRequest(_message.Message):
+    __slots__ = ("id", "offset", "limit", "sample_size", "seed")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    SEED_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    offset: int
+    limit: int
+    sample_size: int
+    seed: int
+    def __init__(self, id: _Optional[int] = ..., offset: _Optional[int] = ..., limit: _Optional[int] = ..., sample_size: _Optional[int] = ..., seed: _Optional[int] = ...) -> None: ...
+
+class PreviewResponse(_message.Message):
+    __slots__ = ("rows_data", "total_rows")
+    ROWS_DATA_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_ROWS_FIELD_NUMBER: _ClassVar[int]
+    rows_data: str
+    total_rows: int
+    def __init__(self, rows_data: _Optional[str] = ..., total_rows: _Optional[int] = ...) -> None: ...
+
+class DistributionRequest(_message.Message):
+    __slots__ = ("id", "column", "bins", "include_chart", "format", "dpi", "width", "height")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    COLUMN_FIELD_NUMBER: _ClassVar[int]
+    BINS_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_CHART_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    DPI_FIELD_NUMBER: _ClassVar[int]
+    WIDTH_FIELD_NUMBER: _ClassVar[int]
+    HEIGHT_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    column: str
+    bins: int
+    include_chart: bool
+    format: ChartFormat
+    dpi: int
+    width: int
+    height: int
+    def __init__(self, id: _Optional[int] = ..., column: _Optional[str] = ..., bins: _Optional[int] = ..., include_chart: bool = ..., format: _Optional[_Union[ChartFormat, str]] = ..., dpi: _Optional[int] = ..., width: _Optional[int] = ..., height: _Optional[int] = ...) -> None: ...
+
+class DistributionResponse(_message.Message):
+    __slots__ = ("bin_edges", "counts", "kde_x", "kde_y", "chart")
+    BIN_EDGES_FIELD_NUMBER: _ClassVar[int]
+    COUNTS_FIELD_NUMBER: _ClassVar[int]
+    KDE_X_FIELD_NUMBER: _ClassVar[int]
+    KDE_Y_FIELD_NUMBER: _ClassVar[int]
+    CHART_FIELD_NUMBER: _ClassVar[int]
+    bin_edges: _containers.RepeatedScalarFieldContainer[float]
+    counts: _containers.RepeatedScalarFieldContainer[int]
+    kde_x: _containers.RepeatedScalarFieldContainer[float]
+    kde_y: _containers.RepeatedScalarFieldContainer[float]
+    chart: ChartResponse
+    def __init__(self, bin_edges: _Optional[_Iterable[float]] = ..., counts: _Optional[_Iterable[int]] = ..., kde_x: _Optional[_Iterable[float]] = ..., kde_y: _Optional[_Iterable[float]] = ..., chart: _Optional[_Union[ChartResponse, _Mapping]] = ...) -> None: ...
@@ -66,6 +66,16 @@ class AidsServiceStub(object):
                 request_serializer=aids__pb2.ChartRequest.SerializeToString,
                 response_deserializer=aids__pb2.ChartResponse.FromString,
                 _registered_method=True)
+        self.PreviewDataset = channel.unary_unary(
+                '/AidsService/PreviewDataset',
+                request_serializer=aids__pb2.PreviewRequest.SerializeToString,
+                response_deserializer=aids__pb2.PreviewResponse.FromString,
+                _registered_method=True)
+        self.GetDistribution = channel.unary_unary(
+                '/AidsService/GetDistribution',
+                request_serializer=aids__pb2.DistributionRequest.SerializeToString,
+                response_deserializer=aids__pb2.DistributionResponse.FromString,
+                _registered_method=True)
 
 
 class AidsServiceServicer(object):
@@ -114,6 +124,20 @@ class AidsServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PreviewDataset(self, request, context):
+        """For getting a page or a sample of the rows of a dataset without downloading it
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDistribution(self, request, context):
+        """For getting the histogram and KDE of a numeric column
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AidsServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -147,6 +171,16 @@ def add_AidsServiceServicer_to_server(servicer, server):
                     request_deserializer=aids__pb2.ChartRequest.FromString,
                     response_serializer=aids__pb2.ChartResponse.SerializeToString,
             ),
+            'PreviewDataset': grpc.unary_unary_rpc_method_handler(
+                    servicer.PreviewDataset,
+                    request_deserializer=aids__pb2.PreviewRequest.FromString,
+                    response_serializer=aids__pb2.PreviewResponse.SerializeToString,
+            ),
+            'GetDistribution': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDistribution,
+                    request_deserializer=aids__pb2.DistributionRequest.FromString,
+                    response_serializer=aids__pb2.DistributionResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'AidsService', rpc_method_handlers)
@@ -320,3 +354,57 @@ class AidsService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def PreviewDataset(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/AidsService/PreviewDataset',
+            aids__pb2.PreviewRequest.SerializeToString,
+            aids__pb2.PreviewResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetDistribution(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/AidsService/GetDistribution',
+            aids__pb2.DistributionRequest.SerializeToString,
+            aids__pb2.DistributionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
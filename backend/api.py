@@ -1,18 +1,41 @@
 import datetime
-import io
+import json
 import logging
-from typing import override
+from typing import TYPE_CHECKING, override
 import os
 import aids_pb2
 import aids_pb2_grpc
 import grpc
-import pandas as pd
+from access_stats import AccessStats
+from blob_store import BlobStore, create_blob_store
+from dataframe_cache import DataFrameCache
 from database_handler import DatabaseHandler, Dataset
+from warmup import lazy_import
 
 from google.protobuf.empty_pb2 import Empty
 
-import seaborn as sns
-import matplotlib.pyplot as plt
+# The analysis modules load pandas, matplotlib, etc, so they are only run on first use (or by the
+# warm-up) and the server can start right away, see warmup.py
+if TYPE_CHECKING:
+    import charts
+    import csv_loader
+    import distribution
+    import pandas as pd
+    import row_index
+else:
+    charts = lazy_import("charts")
+    csv_loader = lazy_import("csv_loader")
+    distribution = lazy_import("distribution")
+    row_index = lazy_import("row_index")
+
+DEFAULT_PREVIEW_ROWS = 100
+MAX_PREVIEW_ROWS = 1000
+
+# Name of the operation for the cache of GetDatasetSummary. Dont touch.
+SUMMARY_CACHE_OPERATION = "describe"
+
+# memory the loaded DataFrames can use, in MB
+DATAFRAME_CACHE_MB = int(os.environ.get("AIDS_DATAFRAME_CACHE_MB", "1024"))
 
 
 class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
@@ -22,6 +45,93 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
 
     def __init__(self) -> None:
         self.db_handler: DatabaseHandler = DatabaseHandler()
+        self.access_stats: AccessStats = AccessStats(self.db_handler)
+        self.blob_store: BlobStore = create_blob_store()
+        self.df_cache: DataFrameCache = DataFrameCache(DATAFRAME_CACHE_MB * 1024 * 1024)
+
+    def _load_dataframe(
+        self,
+        dataset_id: int,
+        file_route: str,
+        columns: list[str] | None = None,
+        cache: bool = True,
+    ) -> "pd.DataFrame":
+        """
+        Loads a dataset with compact dtypes. Uses the schema saved at upload if there is one,
+        otherwise (datasets uploaded before schemas existed) infers it again.
+
+        Full loads are kept in the DataFrame cache (unless cache is False), partial loads are
+        served from it if the full dataset is already there. The result must not be modified.
+        """
+        cached = self.df_cache.get(dataset_id)
+        if cached is not None:
+            return cached if columns is None else cached[columns]
+
+        file_path = self.blob_store.local_path(file_route)
+        schema = self.db_handler.get_schema(dataset_id)
+        if schema is None:
+            df = csv_loader.optimize_dtypes(
+                csv_loader.read_csv(file_path, columns=columns)
+            )
+        else:
+            df = csv_loader.read_csv(file_path, columns=columns, schema=schema)
+
+        if columns is None and cache:
+            _ = self.df_cache.put(dataset_id, df)
+
+        return df
+
+    def _build_row_index(self, file_route: str, file_path: str) -> int:
+        """
+        Builds the row index of a dataset from its local copy and saves it in the blob store.
+        Returns the number of rows.
+        """
+        row_count = row_index.build_row_index(file_path)
+        self.blob_store.upload(
+            row_index.row_index_route(file_route), row_index.row_index_route(file_path)
+        )
+        return row_count
+
+    def _build_summary(self, dataset_id: int, df: "pd.DataFrame") -> str:
+        """
+        Generates the summary of a dataset and saves it in the cache.
+        """
+        # describe() on the float32 columns gives a different std, mean, etc than on the original data
+        summary = csv_loader.widen_floats(df).describe().to_json()
+        self.db_handler.add_cache(dataset_id, SUMMARY_CACHE_OPERATION, summary)
+        return summary
+
+    def warm_up_datasets(self, top_n: int, memory_limit: int):
+        """
+        Loads the top_n most used datasets into the DataFrame cache and rebuilds their summary
+        if it's not cached. Datasets stop being loaded once they would use more than memory_limit bytes.
+        """
+        used_bytes = 0
+        for dataset_id, file_route in self.db_handler.get_most_used(top_n):
+            try:
+                # the CSV size is a rough estimate of the DataFrame size, to skip loading huge files
+                if used_bytes + self.blob_store.size(file_route) > memory_limit:
+                    logging.info(f"Warm-up skipped dataset {dataset_id}, too big")
+                    continue
+
+                df = self._load_dataframe(dataset_id, file_route, cache=False)
+
+                if (
+                    self.db_handler.get_cache(dataset_id, SUMMARY_CACHE_OPERATION)
+                    is None
+                ):
+                    _ = self._build_summary(dataset_id, df)
+
+                size = int(df.memory_usage(deep=True).sum())
+                if used_bytes + size <= memory_limit and self.df_cache.put(
+                    dataset_id, df
+                ):
+                    used_bytes += size
+                    logging.info(f"Warm-up loaded dataset {dataset_id} ({size} bytes)")
+            except Exception as e:
+                logging.error(
+                    f"Warm-up failed for dataset {dataset_id} with error: {e}"
+                )
 
     @override
     def UploadCsv(
@@ -41,11 +151,44 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
             return aids_pb2.UploadResponse()
 
         try:
-            file_path = self.db_handler.save_csv_file(file_content, file_name)
-
-            dataset = Dataset(file_name=file_name, file_route=file_path, date=file_date)
+            file_route = self.blob_store.save_csv_file(file_content, file_name)
+            file_path = self.blob_store.local_path(file_route)
+
+            # infer the compact dtypes once, so later loads don't have to
+            df = None
+            try:
+                df = csv_loader.optimize_dtypes(csv_loader.read_csv(file_path))
+                schema = json.dumps(csv_loader.infer_schema(df))
+            except Exception as e:
+                logging.error(
+                    f"Function UploadCsv failed to infer schema with error: {e}"
+                )
+                schema = None
+
+            # index of row offsets, so PreviewDataset can read any page with one seek
+            try:
+                row_count = self._build_row_index(file_route, file_path)
+            except Exception as e:
+                logging.error(
+                    f"Function UploadCsv failed to build row index with error: {e}"
+                )
+                row_count = None
+
+            dataset = Dataset(
+                file_name=file_name,
+                file_route=file_route,
+                date=file_date,
+                schema=schema,
+                row_count=row_count,
+            )
             dataset_id = self.db_handler.add_dataset(dataset)
 
+            # the frame was just parsed, keep it so the first summary or chart doesn't parse it again.
+            # With replicas envoy sends the upload anywhere, but the dataset's requests to the one
+            # its id hashes to, so here it would only push out frames this replica does serve
+            if df is not None and not self.blob_store.shared:
+                _ = self.df_cache.put(dataset_id, df)
+
             return aids_pb2.UploadResponse(
                 id=dataset_id, message=f"File '{file_name}' uploaded successfully."
             )
@@ -63,13 +206,11 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
         """
         logging.info("Function GetDatasetSummary called")
 
-        # Name of the operation for the cache. Dont touch.
-        CACHE_OPERATION_NAME = "describe"
-
         dataset_id = request.id
+        self.access_stats.record(dataset_id)
 
         # Check cache first
-        cached_summary = self.db_handler.get_cache(dataset_id, CACHE_OPERATION_NAME)
+        cached_summary = self.db_handler.get_cache(dataset_id, SUMMARY_CACHE_OPERATION)
         if cached_summary:
             logging.info(
                 f"Function GetDatasetSummary returned cached value {cached_summary}"
@@ -88,11 +229,8 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
             return aids_pb2.SummaryResponse()
 
         try:
-            df = pd.read_csv(file_route)
-            summary = df.describe().to_json()
-
-            # Add to cache
-            self.db_handler.add_cache(dataset_id, CACHE_OPERATION_NAME, summary)
+            df = self._load_dataframe(dataset_id, file_route)
+            summary = self._build_summary(dataset_id, df)
 
             logging.info(f"Function GetDatasetSummary returned value {summary}")
             return aids_pb2.SummaryResponse(summary_data=summary)
@@ -147,10 +285,11 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
                 return Empty()
 
             self.db_handler.remove_dataset(request.id)
+            self.df_cache.remove(request.id)
 
-            # delete the actual file from the disk
-            if os.path.exists(file_route):
-                os.remove(file_route)
+            # delete the actual file and its index from the blob store
+            self.blob_store.delete(file_route)
+            self.blob_store.delete(row_index.row_index_route(file_route))
 
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -174,7 +313,7 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
             # get file name from the file_route
             file_name = os.path.basename(file_route)
 
-            with open(file_route, "rb") as f:
+            with open(self.blob_store.local_path(file_route), "rb") as f:
                 file_content = f.read()
 
             return aids_pb2.Chunk(content=file_content, file_name=file_name)
@@ -195,16 +334,32 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
         logging.info("Function GetChart called")
 
         file_id = request.id
+        self.access_stats.record(file_id)
         x_axis = request.x_axis
         y_axis = request.y_axis
+        chart_format = request.format
+        dpi = request.dpi
+        width = request.width
+        height = request.height
+
+        error = charts.validate_chart_options(chart_format, dpi, width, height)
+        if error:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(error)
+            logging.info(f"Function GetChart failed with invalid options: {error}")
+            return aids_pb2.ChartResponse()
 
         CACHE_OPERATION_NAME = "getchart"
-        CACHE_OPERATION_FULLN = f"{CACHE_OPERATION_NAME}_{x_axis}_{y_axis}"
+        CACHE_OPERATION_FULLN = f"{CACHE_OPERATION_NAME}_{x_axis}_{y_axis}_{charts.chart_cache_suffix(chart_format, dpi, width, height)}"
 
-        cached_svg = self.db_handler.get_cache(file_id, CACHE_OPERATION_FULLN)
-        if cached_svg:
-            logging.info(f"Function GetChart returned with cached value: {cached_svg}")
-            return aids_pb2.ChartResponse(svg=cached_svg)
+        cached_chart = self.db_handler.get_cache(file_id, CACHE_OPERATION_FULLN)
+        if cached_chart:
+            logging.info(
+                f"Function GetChart returned with cached value: {CACHE_OPERATION_FULLN}"
+            )
+            return charts.chart_response(
+                chart_format, charts.chart_from_cache(chart_format, cached_chart)
+            )
 
         file_route = self.db_handler.get_file_route(file_id)
 
@@ -217,28 +372,208 @@ class AidsServiceServicer(aids_pb2_grpc.AidsServiceServicer):
                 )
                 return aids_pb2.ChartResponse()
 
-            df = pd.read_csv(file_route)
-            # df = pd.read_csv(file_route, usecols=[x_axis, y_axis])
-
-            svg_buffer = io.StringIO()
-
-            sns.set_theme(style="whitegrid")
-            plot = sns.scatterplot(x=x_axis, y=y_axis, data=df)
-            plot.set_xlabel(x_axis)
-            plot.set_ylabel(y_axis)
-
-            plt.savefig(svg_buffer, format="svg")
-            plt.close()
+            # only parse the columns that are plotted
+            df = self._load_dataframe(
+                file_id, file_route, columns=list(dict.fromkeys([x_axis, y_axis]))
+            )
 
-            svg = svg_buffer.getvalue()
+            chart = charts.render_chart(
+                lambda ax: charts.draw_scatter(ax, df, x_axis, y_axis),
+                chart_format,
+                dpi,
+                width,
+                height,
+            )
 
-            self.db_handler.add_cache(file_id, CACHE_OPERATION_FULLN, svg)
+            self.db_handler.add_cache(
+                file_id,
+                CACHE_OPERATION_FULLN,
+                charts.chart_to_cache(chart_format, chart),
+            )
 
-            logging.info(f"Function GetChart returned with value: {svg}")
-            return aids_pb2.ChartResponse(svg=svg)
+            logging.info(
+                f"Function GetChart returned {charts.FORMAT_NAMES[chart_format]} chart of {len(chart)} bytes"
+            )
+            return charts.chart_response(chart_format, chart)
 
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Failed to get/generate chart: {e}")
             logging.error(f"Function GetChart failed with error: {e}")
             return aids_pb2.ChartResponse()
+
+    @override
+    def PreviewDataset(
+        self, request: aids_pb2.PreviewRequest, context: grpc.ServicerContext
+    ) -> aids_pb2.PreviewResponse:
+        """
+        Returns a page of rows, or a random sample of rows, of a dataset. Uses the row index built
+        at upload so only the needed part of the file is read.
+        """
+        logging.info("Function PreviewDataset called")
+
+        dataset_id = request.id
+        self.access_stats.record(dataset_id)
+        offset = request.offset
+        limit = request.limit or DEFAULT_PREVIEW_ROWS
+        sample_size = request.sample_size
+
+        if offset < 0 or not 0 < limit <= MAX_PREVIEW_ROWS:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(
+                f"offset can't be negative and limit must be between 1 and {MAX_PREVIEW_ROWS}."
+            )
+            return aids_pb2.PreviewResponse()
+
+        if not 0 <= sample_size <= MAX_PREVIEW_ROWS or request.seed < 0:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(
+                f"sample_size must be between 0 and {MAX_PREVIEW_ROWS} and seed can't be negative."
+            )
+            return aids_pb2.PreviewResponse()
+
+        file_route = self.db_handler.get_file_route(dataset_id)
+
+        try:
+            if not file_route:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Dataset with id {dataset_id} not found.")
+                logging.info(
+                    f"Function PreviewDataset failed with file_route value: {file_route}"
+                )
+                return aids_pb2.PreviewResponse()
+
+            file_path = self.blob_store.local_path(file_route)
+            index_route = row_index.row_index_route(file_route)
+            row_count = self.db_handler.get_row_count(dataset_id)
+            if row_count is None or not self.blob_store.exists(index_route):
+                # datasets uploaded before the index existed
+                row_count = self._build_row_index(file_route, file_path)
+                self.db_handler.set_row_count(dataset_id, row_count)
+            index = row_index.load_row_index(self.blob_store.local_path(index_route))
+
+            if sample_size > 0:
+                df = row_index.read_row_sample(
+                    file_path, index, row_count, sample_size, request.seed
+                )
+            else:
+                df = row_index.read_row_range(
+                    file_path, index, offset, min(offset + limit, row_count)
+                )
+
+            logging.info(f"Function PreviewDataset returned {len(df)} rows")
+            return aids_pb2.PreviewResponse(
+                rows_data=df.to_json(orient="split"), total_rows=row_count
+            )
+
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to preview dataset: {e}")
+            logging.error(f"Function PreviewDataset failed with error: {e}")
+            return aids_pb2.PreviewResponse()
+
+    @override
+    def GetDistribution(
+        self, request: aids_pb2.DistributionRequest, context: grpc.ServicerContext
+    ) -> aids_pb2.DistributionResponse:
+        """
+        Returns the histogram and KDE of a numeric column, and optionally a chart of them.
+        If the dataset isn't in memory the column is streamed from the file in chunks.
+        """
+        logging.info("Function GetDistribution called")
+
+        dataset_id = request.id
+        self.access_stats.record(dataset_id)
+        column = request.column
+        bins = request.bins or distribution.DEFAULT_BINS
+        chart_format = request.format
+        dpi = request.dpi
+        width = request.width
+        height = request.height
+
+        if not 0 < bins <= distribution.MAX_BINS:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"bins must be between 1 and {distribution.MAX_BINS}.")
+            return aids_pb2.DistributionResponse()
+
+        error = charts.validate_chart_options(chart_format, dpi, width, height)
+        if error:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(error)
+            logging.info(
+                f"Function GetDistribution failed with invalid options: {error}"
+            )
+            return aids_pb2.DistributionResponse()
+
+        CACHE_OPERATION_NAME = "distribution"
+        CACHE_OPERATION_FULLN = f"{CACHE_OPERATION_NAME}_{column}_{bins}"
+        CACHE_OPERATION_CHART = f"{CACHE_OPERATION_FULLN}_{charts.chart_cache_suffix(chart_format, dpi, width, height)}"
+
+        file_route = self.db_handler.get_file_route(dataset_id)
+
+        try:
+            if not file_route:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Dataset with id {dataset_id} not found.")
+                logging.info(
+                    f"Function GetDistribution failed with file_route value: {file_route}"
+                )
+                return aids_pb2.DistributionResponse()
+
+            cached_distribution = self.db_handler.get_cache(
+                dataset_id, CACHE_OPERATION_FULLN
+            )
+            if cached_distribution:
+                result = json.loads(cached_distribution)
+            else:
+                df = self.df_cache.get(dataset_id)
+                if df is not None:
+                    chunks = distribution.frame_column_chunks(df, column)
+                else:
+                    # the local copy is looked up on every pass, the blob store may have evicted it
+                    def chunks():
+                        return csv_loader.iter_numeric_column(
+                            self.blob_store.local_path(file_route), column
+                        )
+
+                result = distribution.compute_distribution(chunks, bins)
+                self.db_handler.add_cache(
+                    dataset_id, CACHE_OPERATION_FULLN, json.dumps(result)
+                )
+
+            response = aids_pb2.DistributionResponse(**result)
+
+            if request.include_chart:
+                cached_chart = self.db_handler.get_cache(
+                    dataset_id, CACHE_OPERATION_CHART
+                )
+                if cached_chart:
+                    chart = charts.chart_from_cache(chart_format, cached_chart)
+                else:
+                    chart = charts.render_chart(
+                        lambda ax: charts.draw_distribution(ax, result, column),
+                        chart_format,
+                        dpi,
+                        width,
+                        height,
+                    )
+                    self.db_handler.add_cache(
+                        dataset_id,
+                        CACHE_OPERATION_CHART,
+                        charts.chart_to_cache(chart_format, chart),
+                    )
+                response.chart.CopyFrom(charts.chart_response(chart_format, chart))
+
+            logging.info(f"Function GetDistribution returned {bins} bins of {column}")
+            return response
+
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            logging.info(f"Function GetDistribution failed with error: {e}")
+            return aids_pb2.DistributionResponse()
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Failed to get/generate distribution: {e}")
+            logging.error(f"Function GetDistribution failed with error: {e}")
+            return aids_pb2.DistributionResponse()
@@ -0,0 +1,304 @@
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import override
+
+# "local" keeps the files in a directory, "s3" in an S3 compatible bucket (AWS, MinIO, etc)
+BLOB_STORE = os.environ.get("AIDS_BLOB_STORE", "local")
+
+LOCAL_BLOB_DIR = os.environ.get(
+    "AIDS_BLOB_DIR", os.path.join(os.path.dirname(__file__), ".data")
+)
+
+S3_BUCKET = os.environ.get("AIDS_S3_BUCKET", "aids-datasets")
+# empty for AWS, the MinIO url otherwise (ex: http://minio:9000)
+S3_ENDPOINT_URL = os.environ.get("AIDS_S3_ENDPOINT_URL") or None
+
+# where the S3 store keeps the local copies of the files it has read
+S3_CACHE_DIR = os.environ.get(
+    "AIDS_S3_CACHE_DIR", os.path.join(tempfile.gettempdir(), "aids-blobs")
+)
+
+# disk the local copies can use, in MB. The least recently used ones are deleted past it
+S3_CACHE_MB = int(os.environ.get("AIDS_S3_CACHE_MB", "4096"))
+
+# copies used in the last S3_CACHE_GRACE seconds are never deleted, they may still be being read
+S3_CACHE_GRACE = int(os.environ.get("AIDS_S3_CACHE_GRACE", "600"))
+
+# prefix of the files being downloaded to the cache
+TEMP_PREFIX = ".tmp-"
+
+
+class BlobStore(ABC):
+    """
+    Storage of the dataset files (and the files derived from them, like the row index).
+    Files are identified by a key, which is what gets saved as the file_route of a Dataset.
+
+    Readers always work on a local file (see local_path), so pyarrow, seeks, etc keep working
+    no matter where the files are stored.
+    """
+
+    # True if every replica sees the files, so the requests for a dataset may go to another one
+    shared: bool = False
+
+    def save_csv_file(self, file_content: bytes, original_file_name: str) -> str:
+        """
+        Saves the content of a CSV file and returns its key.
+        The key is a unique file name, so uploads with the same name don't collide.
+        """
+        timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
+        base_name, ext = os.path.splitext(os.path.basename(original_file_name))
+        key = f"{base_name}_{timestamp}{ext}"
+
+        self.put(key, file_content)
+        return key
+
+    @abstractmethod
+    def put(self, key: str, content: bytes):
+        """
+        Saves content under key, replacing it if it exists.
+        """
+
+    @abstractmethod
+    def upload(self, key: str, local_path: str):
+        """
+        Saves the file at local_path under key, replacing it if it exists.
+        """
+
+    @abstractmethod
+    def local_path(self, key: str) -> str:
+        """
+        Returns the path of a local copy of key. Raises FileNotFoundError if it doesn't exist.
+        """
+
+    @abstractmethod
+    def size(self, key: str) -> int:
+        """
+        Returns the size of key in bytes, without downloading it. Raises FileNotFoundError if it doesn't exist.
+        """
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """
+        Returns True if key exists.
+        """
+
+    @abstractmethod
+    def delete(self, key: str):
+        """
+        Deletes key, if it exists.
+        """
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Keeps the files in a local directory. Only works with a single backend, or with the directory
+    on a disk shared by every replica.
+    """
+
+    def __init__(self, root: str = LOCAL_BLOB_DIR) -> None:
+        self.root: str = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        # datasets uploaded before the blob store saved their absolute path as the key
+        if os.path.isabs(key):
+            return key
+        return os.path.join(self.root, key)
+
+    @override
+    def put(self, key: str, content: bytes):
+        with open(self._path(key), "wb") as f:
+            _ = f.write(content)
+
+    @override
+    def upload(self, key: str, local_path: str):
+        path = self._path(key)
+        if os.path.abspath(local_path) != os.path.abspath(path):
+            _ = shutil.copyfile(local_path, path)
+
+    @override
+    def local_path(self, key: str) -> str:
+        path = self._path(key)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found at {path}.")
+        return path
+
+    @override
+    def size(self, key: str) -> int:
+        return os.path.getsize(self.local_path(key))
+
+    @override
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    @override
+    def delete(self, key: str):
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class S3BlobStore(BlobStore):
+    """
+    Keeps the files in an S3 compatible bucket, so every replica sees the same files.
+    Files are downloaded to cache_dir the first time a replica reads them, and the least recently
+    used copies are deleted once they take more than cache_bytes.
+
+    Needs boto3. Credentials are read by boto3 from the usual places (AWS_ACCESS_KEY_ID, etc).
+    """
+
+    shared: bool = True
+
+    def __init__(
+        self,
+        bucket: str = S3_BUCKET,
+        endpoint_url: str | None = S3_ENDPOINT_URL,
+        cache_dir: str = S3_CACHE_DIR,
+        cache_bytes: int = S3_CACHE_MB * 1024 * 1024,
+    ) -> None:
+        import boto3
+        from botocore.exceptions import ClientError
+
+        self.bucket: str = bucket
+        self.cache_dir: str = cache_dir
+        self.cache_bytes: int = cache_bytes
+        self._cache_lock: threading.Lock = threading.Lock()
+        self._client = boto3.client("s3", endpoint_url=endpoint_url)  # pyright: ignore[reportUnknownMemberType]
+        self._client_error: type[ClientError] = ClientError
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # every replica tries to create it at startup, only the first one does
+        try:
+            _ = self._client.create_bucket(Bucket=self.bucket)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in (
+                "BucketAlreadyOwnedByYou",
+                "BucketAlreadyExists",
+            ):
+                raise
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    @override
+    def put(self, key: str, content: bytes):
+        _ = self._client.put_object(Bucket=self.bucket, Key=key, Body=content)
+
+        # keep a local copy, the file is read right after uploading it
+        self._write_cache(key, content)
+
+    @override
+    def upload(self, key: str, local_path: str):
+        self._client.upload_file(local_path, self.bucket, key)
+
+        if os.path.abspath(local_path) != os.path.abspath(self._cache_path(key)):
+            with open(local_path, "rb") as f:
+                self._write_cache(key, f.read())
+
+    @override
+    def local_path(self, key: str) -> str:
+        path = self._cache_path(key)
+        try:
+            # the modification time is the last use, for the eviction
+            os.utime(path)
+            return path
+        except FileNotFoundError:
+            pass
+
+        # download to a temporary file first, so other threads never see half a file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=TEMP_PREFIX)
+        os.close(fd)
+        try:
+            self._client.download_file(self.bucket, key, tmp_path)
+            os.replace(tmp_path, path)
+        except self._client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"File {key} not found in the bucket.") from e
+            raise
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._evict()
+        return path
+
+    @override
+    def size(self, key: str) -> int:
+        try:
+            response = self._client.head_object(Bucket=self.bucket, Key=key)
+        except self._client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"File {key} not found in the bucket.") from e
+            raise
+        return response["ContentLength"]
+
+    @override
+    def exists(self, key: str) -> bool:
+        if os.path.exists(self._cache_path(key)):
+            return True
+
+        try:
+            _ = self._client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except self._client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+
+    @override
+    def delete(self, key: str):
+        _ = self._client.delete_object(Bucket=self.bucket, Key=key)
+
+        path = self._cache_path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _write_cache(self, key: str, content: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=TEMP_PREFIX)
+        with os.fdopen(fd, "wb") as f:
+            _ = f.write(content)
+        os.replace(tmp_path, self._cache_path(key))
+        self._evict()
+
+    def _evict(self):
+        """
+        Deletes the least recently used copies until the cache fits in cache_bytes. Copies used in
+        the last S3_CACHE_GRACE seconds are kept even if it doesn't fit, someone may be reading them.
+        """
+        with self._cache_lock:
+            entries: list[tuple[float, int, str]] = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.startswith(TEMP_PREFIX) or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            used_bytes = sum(size for _, size, _ in entries)
+            grace_start = time.time() - S3_CACHE_GRACE
+            for last_use, size, path in sorted(entries):
+                if used_bytes <= self.cache_bytes or last_use > grace_start:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                used_bytes -= size
+
+
+def create_blob_store() -> BlobStore:
+    """
+    Creates the blob store selected with AIDS_BLOB_STORE.
+    """
+    if BLOB_STORE == "s3":
+        return S3BlobStore()
+    if BLOB_STORE == "local":
+        return LocalBlobStore()
+    raise ValueError(f"Unknown blob store '{BLOB_STORE}', use 'local' or 's3'.")
@@ -0,0 +1,131 @@
+import base64
+import io
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+import aids_pb2
+
+DEFAULT_DPI = 100
+DEFAULT_WIDTH = 640
+DEFAULT_HEIGHT = 480
+
+# limits so a single request can't make the server render a gigantic image
+MAX_DPI = 600
+MAX_SIZE = 8192
+
+# set once, the theme is global and is applied when a figure is created
+sns.set_theme(style="whitegrid")
+
+FORMAT_NAMES: dict[int, str] = {
+    aids_pb2.SVG: "svg",
+    aids_pb2.PNG: "png",
+    aids_pb2.WEBP: "webp",
+}
+
+
+def validate_chart_options(
+    chart_format: int, dpi: int, width: int, height: int
+) -> str | None:
+    """
+    Checks the output options of a chart request. Returns an error message if they are invalid, None otherwise.
+    """
+    if chart_format not in FORMAT_NAMES:
+        return f"Unknown chart format {chart_format}."
+    if not 0 <= dpi <= MAX_DPI:
+        return f"dpi must be between 1 and {MAX_DPI}, or 0 for the default."
+    if not 0 <= width <= MAX_SIZE or not 0 <= height <= MAX_SIZE:
+        return (
+            f"width and height must be between 1 and {MAX_SIZE}, or 0 for the default."
+        )
+    return None
+
+
+def chart_cache_suffix(chart_format: int, dpi: int, width: int, height: int) -> str:
+    """
+    Part of the cache key that depends on the output options, so every format and size is cached separately.
+    """
+    return f"{FORMAT_NAMES[chart_format]}_{dpi or DEFAULT_DPI}_{width or DEFAULT_WIDTH}x{height or DEFAULT_HEIGHT}"
+
+
+def render_chart(
+    draw: Callable[[Axes], None], chart_format: int, dpi: int, width: int, height: int
+) -> bytes:
+    """
+    Creates a new figure with the requested size, calls draw to plot on its axes and returns the
+    encoded chart. For SVG the bytes are the UTF-8 SVG string.
+
+    The figure isn't created with pyplot, whose current figure is shared by every thread, so
+    charts rendered at the same time can't draw on each other.
+    """
+    dpi = dpi or DEFAULT_DPI
+    width = width or DEFAULT_WIDTH
+    height = height or DEFAULT_HEIGHT
+
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    ax = fig.add_subplot()
+    draw(ax)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=FORMAT_NAMES[chart_format], dpi=dpi)
+    return buffer.getvalue()
+
+
+def draw_scatter(ax: Axes, df: pd.DataFrame, x_axis: str, y_axis: str):
+    """
+    Draws a scatter plot of two columns of a dataset on ax.
+    """
+    _ = sns.scatterplot(x=x_axis, y=y_axis, data=df, ax=ax)
+    _ = ax.set_xlabel(x_axis)
+    _ = ax.set_ylabel(y_axis)
+
+
+def draw_distribution(
+    ax: Axes, distribution: dict[str, list[float] | list[int]], column: str
+):
+    """
+    Draws a histogram and its KDE (see distribution.compute_distribution) on ax.
+    The KDE is scaled to the counts so both share the y axis.
+    """
+    edges = np.array(distribution["bin_edges"])
+    counts = np.array(distribution["counts"])
+    _ = ax.stairs(counts, edges, fill=True, alpha=0.6)
+
+    if distribution["kde_x"]:
+        bin_width = edges[1] - edges[0]
+        kde_y = np.array(distribution["kde_y"]) * counts.sum() * bin_width
+        _ = ax.plot(distribution["kde_x"], kde_y)
+
+    _ = ax.set_xlabel(column)
+    _ = ax.set_ylabel("count")
+
+
+def chart_to_cache(chart_format: int, chart: bytes) -> str:
+    """
+    The cache only stores text, SVGs are stored as is and images as base64.
+    """
+    if chart_format == aids_pb2.SVG:
+        return chart.decode("utf-8")
+    return base64.b64encode(chart).decode("ascii")
+
+
+def chart_from_cache(chart_format: int, cached: str) -> bytes:
+    """
+    Inverse of chart_to_cache.
+    """
+    if chart_format == aids_pb2.SVG:
+        return cached.encode("utf-8")
+    return base64.b64decode(cached)
+
+
+def chart_response(chart_format: int, chart: bytes) -> aids_pb2.ChartResponse:
+    """
+    Builds the response for an encoded chart, SVGs go in the svg field and images in the image field.
+    """
+    if chart_format == aids_pb2.SVG:
+        return aids_pb2.ChartResponse(svg=chart.decode("utf-8"), format=chart_format)
+    return aids_pb2.ChartResponse(image=chart, format=chart_format)
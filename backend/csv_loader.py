@@ -0,0 +1,229 @@
+import logging
+import os
+from collections.abc import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv
+
+# Size of each block pyarrow parses on its own thread. Bigger blocks mean less overhead on
+# big files, but every thread holds one block in memory at a time.
+CSV_BLOCK_SIZE = int(os.environ.get("AIDS_CSV_BLOCK_SIZE", str(16 * 1024 * 1024)))
+
+# String columns with fewer unique values than this fraction of the rows become categoricals.
+CATEGORY_MAX_RATIO = 0.5
+
+# dtype used for the string columns that don't become categoricals
+ARROW_STRING_DTYPE = "string[pyarrow]"
+
+# the values pd.read_csv reads as missing by default, pyarrow's list lacks "<NA>" and "None"
+NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+def read_csv(
+    file_route: str,
+    columns: list[str] | None = None,
+    schema: dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """
+    Reads a CSV into a DataFrame using the pyarrow multithreaded reader, so the file is split in
+    blocks and parsed on every core instead of just one.
+
+    The result matches pd.read_csv: duplicated header names get renamed (a, a.1, ...) and the
+    same values are read as missing. If columns is given only those columns are converted.
+    If schema is given (see infer_schema) pyarrow parses the columns straight into those dtypes,
+    without inferring them first. Falls back to the pandas C engine if pyarrow can't parse the
+    file (ragged rows, weird quoting, etc).
+    """
+    # only reads the header, pandas renames the duplicated and empty names
+    column_names = pd.read_csv(file_route, nrows=0).columns.tolist()
+    column_types, types_mapper = _arrow_types(schema or {})
+
+    try:
+        table = csv.read_csv(
+            file_route,
+            read_options=csv.ReadOptions(
+                use_threads=True,
+                block_size=CSV_BLOCK_SIZE,
+                column_names=column_names,
+                skip_rows=1,
+            ),
+            convert_options=csv.ConvertOptions(
+                include_columns=columns,
+                column_types=column_types,
+                null_values=NULL_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+        df = _to_pandas(table, types_mapper)
+    except pa.ArrowInvalid as e:
+        logging.info(f"pyarrow failed to parse {file_route}, using the C engine: {e}")
+        df = pd.read_csv(file_route, usecols=columns)
+
+    # the dtypes pyarrow can't parse into (dates, object, ...) and the C engine fallback
+    casts = {
+        col: dtype
+        for col, dtype in (schema or {}).items()
+        if col in df.columns and df[col].dtype != dtype
+    }
+    if casts:
+        df = df.astype(casts)
+
+    return df
+
+
+def _arrow_types(
+    schema: dict[str, str],
+) -> tuple[dict[str, pa.DataType], Callable[[pa.DataType], object] | None]:
+    """
+    Returns the pyarrow column_types for the dtypes of schema it can parse directly, and the
+    types_mapper that turns its strings into arrow backed pandas strings (None without schema,
+    so the strings are the same pd.read_csv returns).
+    """
+    if not schema:
+        return {}, None
+
+    column_types: dict[str, pa.DataType] = {}
+    for col, dtype in schema.items():
+        if dtype == "category":
+            # dictionary encoded columns become categoricals in to_pandas
+            column_types[col] = pa.dictionary(pa.int32(), pa.string())
+        elif dtype == ARROW_STRING_DTYPE:
+            column_types[col] = pa.string()
+        elif dtype == "bool" or dtype.startswith(("int", "uint", "float")):
+            column_types[col] = pa.from_numpy_dtype(np.dtype(dtype))
+
+    string_dtype = pd.StringDtype("pyarrow")
+    types_mapper = {
+        pa.string(): string_dtype,
+        pa.large_string(): string_dtype,
+    }.get
+    return column_types, types_mapper
+
+
+def _to_pandas(
+    table: pa.Table, types_mapper: Callable[[pa.DataType], object] | None
+) -> pd.DataFrame:
+    # columns without any value are float NaN in pandas, pyarrow would make them object
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, pa.nulls(len(table), pa.float64()))
+
+    df = table.to_pandas(types_mapper=types_mapper)
+
+    # same category order as astype("category"), the dictionary keeps the order they appear in
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            df[col] = df[col].cat.reorder_categories(dtype.categories.sort_values())
+
+    return df
+
+
+def iter_numeric_column(file_route: str, column: str) -> Iterator[np.ndarray]:
+    """
+    Streams one column of a CSV as float64 arrays of about CSV_BLOCK_SIZE bytes each, so big
+    files can be processed without loading them whole. Missing values are NaN.
+
+    Raises ValueError if the column doesn't exist or isn't numeric.
+    """
+    try:
+        reader = csv.open_csv(
+            file_route,
+            read_options=csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            # the streaming reader is serial anyway, so quoted newlines cost nothing
+            parse_options=csv.ParseOptions(newlines_in_values=True),
+            convert_options=csv.ConvertOptions(
+                include_columns=[column], column_types={column: pa.float64()}
+            ),
+        )
+        for batch in reader:
+            yield batch.column(0).to_numpy(zero_copy_only=False)
+    except (pa.ArrowInvalid, pa.ArrowKeyError) as e:
+        raise ValueError(
+            f"Column '{column}' doesn't exist or isn't numeric: {e}"
+        ) from e
+
+
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of df using the smallest dtypes that hold the data without losing anything.
+
+    - ints are downcast to the smallest (unsigned if possible) int that fits
+    - floats are downcast to float32 only if every value survives the round trip, statistics on
+      them must use widen_floats
+    - strings with few unique values become categoricals, the rest arrow backed strings
+    """
+    optimized: dict[str, pd.Series] = {}
+    for col in df.columns:
+        series = df[col]
+
+        if pd.api.types.is_bool_dtype(series):
+            optimized[col] = series
+        elif pd.api.types.is_integer_dtype(series):
+            downcast = "unsigned" if series.min() >= 0 else "integer"
+            optimized[col] = pd.to_numeric(series, downcast=downcast)
+        elif pd.api.types.is_float_dtype(series):
+            as_float32 = series.astype(np.float32)
+            if as_float32.astype(series.dtype).equals(series):
+                optimized[col] = as_float32
+            else:
+                optimized[col] = series
+        elif pd.api.types.is_string_dtype(series):
+            non_null = series.count()
+            if non_null and series.nunique() / non_null < CATEGORY_MAX_RATIO:
+                optimized[col] = series.astype("category")
+            else:
+                optimized[col] = series.astype(ARROW_STRING_DTYPE)
+        else:
+            # dates, mixed types, categoricals already, etc
+            optimized[col] = series
+
+    return pd.DataFrame(optimized, index=df.index)
+
+
+def widen_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns df with its float32 columns (see optimize_dtypes) as float64. Statistics must be
+    computed on this, pandas accumulates in the dtype of the column and float32 sums drift.
+    """
+    float32_columns = [col for col, dtype in df.dtypes.items() if dtype == np.float32]
+    if not float32_columns:
+        return df
+    return df.astype({col: np.float64 for col in float32_columns})
+
+
+def infer_schema(df: pd.DataFrame) -> dict[str, str]:
+    """
+    Returns the dtype of every column of an optimized DataFrame (see optimize_dtypes) as strings,
+    so they can be saved in the database and passed back to read_csv.
+    """
+    schema: dict[str, str] = {}
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.StringDtype):
+            # str() drops the storage, and without it pandas falls back to python strings
+            schema[str(col)] = f"string[{dtype.storage}]"
+        else:
+            schema[str(col)] = str(dtype)
+
+    return schema
@@ -0,0 +1,67 @@
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class DataFrameCache:
+    """
+    In memory LRU cache of loaded datasets, limited by the memory the DataFrames use.
+    Complements the operation_cache table, which only stores results.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes: int = max_bytes
+        self._frames: OrderedDict[int, tuple["pd.DataFrame", int]] = OrderedDict()
+        self._used_bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    def get(self, dataset_id: int) -> "pd.DataFrame | None":
+        """
+        Returns the DataFrame of a dataset if it's cached, and marks it as recently used.
+        """
+        with self._lock:
+            entry = self._frames.get(dataset_id)
+            if entry is None:
+                return None
+
+            self._frames.move_to_end(dataset_id)
+            return entry[0]
+
+    def put(self, dataset_id: int, df: "pd.DataFrame") -> bool:
+        """
+        Caches the DataFrame of a dataset, evicting the least recently used ones if needed.
+        Returns False (and doesn't cache it) if it's bigger than the whole cache.
+        """
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            self._remove(dataset_id)
+            while self._used_bytes + size > self.max_bytes:
+                _, (_, evicted_size) = self._frames.popitem(last=False)
+                self._used_bytes -= evicted_size
+
+            self._frames[dataset_id] = (df, size)
+            self._used_bytes += size
+
+        return True
+
+    def remove(self, dataset_id: int):
+        """
+        Removes a dataset from the cache, if it's there.
+        """
+        with self._lock:
+            self._remove(dataset_id)
+
+    def _remove(self, dataset_id: int):
+        entry = self._frames.pop(dataset_id, None)
+        if entry is not None:
+            self._used_bytes -= entry[1]
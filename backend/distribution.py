@@ -0,0 +1,129 @@
+from collections.abc import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BINS = 30
+MAX_BINS = 1000
+
+# The KDE is computed from a histogram with this many bins instead of from every value, so it
+# can be computed while streaming the file.
+KDE_GRID_BINS = 1024
+
+# number of points where the KDE is evaluated
+KDE_POINTS = 200
+
+# how many bandwidths the KDE extends past the data on each side, same as seaborn's default
+KDE_CUT = 3
+
+
+def frame_column_chunks(
+    df: pd.DataFrame, column: str
+) -> Callable[[], Iterable[np.ndarray]]:
+    """
+    Chunks for compute_distribution from a column of a loaded DataFrame, as a single chunk.
+    Raises ValueError if the column doesn't exist or isn't numeric.
+    """
+    if column not in df.columns:
+        raise ValueError(f"Column '{column}' doesn't exist.")
+    if not pd.api.types.is_numeric_dtype(df[column]) or pd.api.types.is_bool_dtype(
+        df[column]
+    ):
+        raise ValueError(f"Column '{column}' isn't numeric.")
+
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    return lambda: [values]
+
+
+def compute_distribution(
+    chunks: Callable[[], Iterable[np.ndarray]], bins: int
+) -> dict[str, list[float] | list[int]]:
+    """
+    Computes the histogram and a gaussian KDE of a numeric column.
+
+    chunks returns the values of the column in chunks (NaN and infinities are ignored, pyarrow
+    parses "inf" as a number) and is called twice, once to find the range and the bandwidth and
+    once to count the values in the bins, so only one chunk has to be in memory at a time.
+
+    Returns a dict (so it can be cached as JSON) with the bin_edges (bins + 1), the counts of
+    every bin, and the points kde_x and densities kde_y of the KDE.
+    """
+    # first pass: count, range and variance (merging the mean and M2 of every chunk)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    low = np.inf
+    high = -np.inf
+    for chunk in chunks():
+        values = chunk[np.isfinite(chunk)]
+        if len(values) == 0:
+            continue
+
+        chunk_count = len(values)
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+
+        total = count + chunk_count
+        delta = chunk_mean - mean
+        m2 += chunk_m2 + delta**2 * count * chunk_count / total
+        mean += delta * chunk_count / total
+        count = total
+
+        low = min(low, float(values.min()))
+        high = max(high, float(values.max()))
+
+    if count == 0:
+        # same as numpy for an empty array
+        low, high = 0.0, 1.0
+    elif low == high:
+        # same as numpy for a constant column
+        low, high = low - 0.5, high + 0.5
+
+    # second pass: bin the values, for the histogram and for the KDE
+    counts = np.zeros(bins, dtype=np.int64)
+    grid_counts = np.zeros(KDE_GRID_BINS, dtype=np.int64)
+    for chunk in chunks():
+        values = chunk[np.isfinite(chunk)]
+        if len(values) == 0:
+            continue
+
+        position = (values - low) / (high - low)
+        counts += _bin(position, bins)
+        grid_counts += _bin(position, KDE_GRID_BINS)
+
+    bin_edges = np.linspace(low, high, bins + 1)
+
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+    if std == 0:
+        # no KDE for less than two different values
+        kde_x = np.array([])
+        kde_y = np.array([])
+    else:
+        # scott's rule, same as scipy and seaborn
+        bandwidth = std * count ** (-1 / 5)
+
+        grid_edges = np.linspace(low, high, KDE_GRID_BINS + 1)
+        grid_centers = (grid_edges[:-1] + grid_edges[1:]) / 2
+
+        kde_x = np.linspace(
+            low - KDE_CUT * bandwidth, high + KDE_CUT * bandwidth, KDE_POINTS
+        )
+        z = (kde_x[:, np.newaxis] - grid_centers[np.newaxis, :]) / bandwidth
+        kernel = np.exp(-0.5 * z**2) / np.sqrt(2 * np.pi)
+        kde_y = kernel @ grid_counts / (count * bandwidth)
+
+    return {
+        "bin_edges": bin_edges.tolist(),
+        "counts": counts.tolist(),
+        "kde_x": kde_x.tolist(),
+        "kde_y": kde_y.tolist(),
+    }
+
+
+def _bin(position: np.ndarray, bins: int) -> np.ndarray:
+    """
+    Counts the values in each of bins equal bins, position is where the value is between the
+    lowest (0) and the highest (1) value. The highest value goes in the last bin, like numpy.
+    """
+    indexes = np.clip((position * bins).astype(np.int64), 0, bins - 1)
+    return np.bincount(indexes, minlength=bins)
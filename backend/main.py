@@ -1,22 +1,52 @@
 from concurrent import futures
 
 import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 
+import aids_pb2
 import aids_pb2_grpc
 from api import AidsServiceServicer
+from warmup import (
+    WARM_UP_DATASETS,
+    WARM_UP_MEMORY_MB,
+    start_warm_up,
+    warm_up_analysis_libraries,
+)
 
 import logging
 
+SERVICE_NAME = aids_pb2.DESCRIPTOR.services_by_name["AidsService"].full_name
+
 
 def serve():
     """Starts the gRPC server and waits for requests."""
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    aids_pb2_grpc.add_AidsServiceServicer_to_server(AidsServiceServicer(), server)
+    servicer = AidsServiceServicer()
+    aids_pb2_grpc.add_AidsServiceServicer_to_server(servicer, server)
+
+    # health check, reports SERVING once the libraries and the most used datasets are warmed up
+    health_servicer = health.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+    for service in ("", SERVICE_NAME):
+        health_servicer.set(service, health_pb2.HealthCheckResponse.NOT_SERVING)
+
     port = server.add_insecure_port("0.0.0.0:50051")
     server.start()
-
     logging.info(f"Server started, listening on port {port}")
+
+    def on_ready() -> None:
+        for service in ("", SERVICE_NAME):
+            health_servicer.set(service, health_pb2.HealthCheckResponse.SERVING)
+        logging.info("Server ready")
+
+    def warm_up_datasets() -> None:
+        servicer.warm_up_datasets(WARM_UP_DATASETS, WARM_UP_MEMORY_MB * 1024 * 1024)
+
+    _ = start_warm_up([warm_up_analysis_libraries, warm_up_datasets], on_ready)
+    _ = servicer.access_stats.start()
+
     server.wait_for_termination()
+    servicer.access_stats.stop()
     logging.info("Server stopped")
 
 
@@ -0,0 +1,95 @@
+"""
+Copies the datasets of a single backend (the SQLite database and the files in its .data directory)
+to the database in AIDS_DATABASE_URL and the blob store in AIDS_BLOB_STORE, which the replicas share.
+
+    python migrate.py [.data directory]
+
+Datasets get new IDs in the shared database, their cached results are copied with them. Datasets
+that are already there are skipped, so it can be run again if it stops halfway.
+"""
+
+import logging
+import os
+import sys
+
+from blob_store import BlobStore, create_blob_store
+from database_handler import DATABASE_URL, DatabaseHandler, Dataset
+from row_index import row_index_route
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), ".data")
+
+
+def migrate_dataset(
+    dataset: Dataset,
+    data_dir: str,
+    source: DatabaseHandler,
+    target: DatabaseHandler,
+    blob_store: BlobStore,
+) -> int | None:
+    """
+    Copies one dataset, returns its new ID or None if it was skipped.
+    """
+    # the old backend saved the absolute path of the file in its container, the new key is the name
+    key = os.path.basename(dataset.file_route)
+    if target.get_dataset_id(key) is not None:
+        logging.info(f"Dataset {dataset.id} ({key}) was already migrated")
+        return None
+
+    file_path = os.path.join(data_dir, key)
+    if not os.path.exists(file_path):
+        logging.warning(f"Dataset {dataset.id} skipped, {file_path} doesn't exist")
+        return None
+
+    blob_store.upload(key, file_path)
+    index_path = row_index_route(file_path)
+    if os.path.exists(index_path):
+        blob_store.upload(row_index_route(key), index_path)
+
+    # the row goes in last, so a dataset is never listed before its file is uploaded
+    new_id = target.add_dataset(
+        Dataset(
+            file_name=dataset.file_name,
+            file_route=key,
+            file_type=dataset.file_type,
+            date=dataset.date,
+            schema=dataset.schema,
+            row_count=dataset.row_count,
+            access_count=dataset.access_count,
+            last_access=dataset.last_access,
+        )
+    )
+    for operation_name, result in source.get_cache_entries(dataset.id):
+        target.add_cache(new_id, operation_name, result)
+
+    logging.info(f"Dataset {dataset.id} ({key}) migrated with id {new_id}")
+    return new_id
+
+
+def migrate(data_dir: str = DEFAULT_DATA_DIR):
+    """
+    Copies every dataset in data_dir/database.db to the shared database and blob store.
+    """
+    if not DATABASE_URL:
+        raise SystemExit(
+            "AIDS_DATABASE_URL is not set, there is no shared database to migrate to."
+        )
+
+    db_path = os.path.join(data_dir, "database.db")
+    if not os.path.exists(db_path):
+        raise SystemExit(f"{db_path} doesn't exist, there is nothing to migrate.")
+
+    source = DatabaseHandler(database_url=f"sqlite:///{db_path}")
+    target = DatabaseHandler()
+    blob_store = create_blob_store()
+
+    migrated = 0
+    for dataset in source.get_datasets():
+        if migrate_dataset(dataset, data_dir, source, target, blob_store) is not None:
+            migrated += 1
+
+    logging.info(f"Migrated {migrated} datasets")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    migrate(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DATA_DIR)
@@ -0,0 +1,212 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+# The index stores the byte offset of one row out of every ROW_INDEX_STEP, so reading any row
+# means one seek and reading at most ROW_INDEX_STEP rows.
+ROW_INDEX_STEP = 256
+
+# bytes read at a time while building the index
+SCAN_CHUNK_SIZE = 16 * 1024 * 1024
+
+NEWLINE = ord("\n")
+QUOTE = ord('"')
+DELIMITER = ord(",")
+
+
+def row_index_route(file_route: str) -> str:
+    """
+    Path (or blob store key) of the index file of a CSV, it's saved next to it.
+    """
+    return f"{file_route}.idx.npy"
+
+
+def build_row_index(file_route: str) -> int:
+    """
+    Scans a CSV and saves the byte offset where every ROW_INDEX_STEP-th row starts (see row_index_route).
+    The first offset is always the end of the header. Returns the number of rows, without the header.
+
+    Newlines inside quoted fields don't end a row, see _quote_states for what counts as quoted.
+    """
+    offsets: list[int] = []
+
+    # row that the next newline ends, the header is row -1
+    next_row = -1
+    in_quotes = 0
+    position = 0
+    last_row_end = -1
+
+    # byte before the chunk, the start of the file counts as the start of a row
+    previous_byte = NEWLINE
+
+    with open(file_route, "rb") as f:
+        while chunk := f.read(SCAN_CHUNK_SIZE):
+            # a chunk never ends in the middle of a run of quotes, so runs are never split
+            while chunk.endswith(b'"') and (extra := f.read(1)):
+                chunk += extra
+
+            data = np.frombuffer(chunk, dtype=np.uint8)
+
+            newlines = np.flatnonzero(data == NEWLINE)
+            newline_states, next_in_quotes = _quote_states(
+                data, newlines, previous_byte, in_quotes
+            )
+            row_ends = newlines[newline_states == 0]
+
+            # row_ends[i] ends row next_row + i, so row next_row + i + 1 starts right after it
+            starting_rows = next_row + 1 + np.arange(len(row_ends))
+            indexed = row_ends[starting_rows % ROW_INDEX_STEP == 0]
+            offsets.extend((position + indexed + 1).tolist())
+
+            if len(row_ends) > 0:
+                last_row_end = position + int(row_ends[-1])
+            next_row += len(row_ends)
+            in_quotes = next_in_quotes
+            previous_byte = int(data[-1])
+            position += len(chunk)
+
+    # last row without a trailing newline
+    if position > last_row_end + 1:
+        next_row += 1
+
+    row_count = max(next_row, 0)
+
+    # offsets[0] is the end of the header even if there are no rows, the rest only exist for real rows
+    kept = max(1, -(-row_count // ROW_INDEX_STEP))
+    index = np.array(offsets[:kept] or [position], dtype=np.int64)
+    np.save(row_index_route(file_route), index)
+
+    return row_count
+
+
+def _quote_states(
+    data: np.ndarray, positions: np.ndarray, previous_byte: int, in_quotes: int
+) -> tuple[np.ndarray, int]:
+    """
+    Returns whether each of the given positions of data is inside a quoted field (1) or not (0),
+    and whether the end of data is. in_quotes is the state at the start of data and previous_byte
+    the byte before it.
+
+    Follows the pandas and pyarrow parsers: a quote only opens a quoted field at the start of a
+    field, elsewhere it's a normal character (5" tv). Inside a quoted field "" is an escaped quote.
+
+    That makes every run of consecutive quotes one of:
+    - at the start of a field, it toggles the state once per quote
+    - elsewhere with an odd length, it always leaves the state unquoted. Inside a quoted field it
+      closes it (plus escaped quotes), outside it's just text
+    - elsewhere with an even length, it doesn't change the state
+    so the state after a run is the parity of the field start runs with an odd length since the
+    last run of the second kind.
+    """
+    quotes = np.flatnonzero(data == QUOTE)
+    if len(quotes) == 0:
+        return np.full(len(positions), in_quotes), in_quotes
+
+    run_first = np.ones(len(quotes), dtype=bool)
+    run_first[1:] = quotes[1:] != quotes[:-1] + 1
+    run_starts = quotes[run_first]
+    run_lengths = np.diff(np.append(np.flatnonzero(run_first), len(quotes)))
+    run_ends = run_starts + run_lengths - 1
+
+    before = np.where(
+        run_starts > 0, data[np.maximum(run_starts - 1, 0)], previous_byte
+    )
+    field_start = (before == DELIMITER) | (before == NEWLINE)
+    odd = run_lengths % 2 == 1
+
+    toggles = np.cumsum(field_start & odd)
+    runs = np.arange(len(run_starts))
+    last_reset = np.maximum.accumulate(np.where(~field_start & odd, runs, -1))
+    state_after = (
+        np.where(
+            last_reset >= 0,
+            toggles - toggles[np.maximum(last_reset, 0)],
+            toggles + in_quotes,
+        )
+        % 2
+    )
+
+    # the state at a position is the state after the last run before it
+    last_run = np.searchsorted(run_ends, positions) - 1
+    states = np.where(last_run >= 0, state_after[np.maximum(last_run, 0)], in_quotes)
+    return states, int(state_after[-1])
+
+
+def load_row_index(index_route: str) -> np.ndarray:
+    """
+    Loads an index saved by build_row_index.
+    """
+    return np.load(index_route)
+
+
+def _read_blocks(file_route: str, index: np.ndarray, blocks: list[int]) -> bytes:
+    """
+    Reads the header and the given blocks of ROW_INDEX_STEP rows, in that order.
+    """
+    with open(file_route, "rb") as f:
+        parts = [f.read(int(index[0]))]
+        for block in blocks:
+            _ = f.seek(int(index[block]))
+            if block + 1 < len(index):
+                parts.append(f.read(int(index[block + 1] - index[block])))
+            else:
+                parts.append(f.read())
+
+    return b"".join(parts)
+
+
+def _parse(data: bytes, positions: list[int]) -> pd.DataFrame:
+    """
+    Parses a CSV read by _read_blocks and keeps the rows at the given positions.
+    """
+    # blank lines count as rows in the index, so they have to here too
+    df = pd.read_csv(io.BytesIO(data), skip_blank_lines=False)
+    return df.iloc[positions]
+
+
+def read_row_range(
+    file_route: str, index: np.ndarray, start: int, stop: int
+) -> pd.DataFrame:
+    """
+    Reads rows [start, stop) using the index. The DataFrame index is the row number in the file.
+    """
+    if start >= stop:
+        return _parse(_read_blocks(file_route, index, []), [])
+
+    first_block = start // ROW_INDEX_STEP
+    last_block = min((stop - 1) // ROW_INDEX_STEP, len(index) - 1)
+    blocks = list(range(first_block, last_block + 1))
+
+    base = first_block * ROW_INDEX_STEP
+    df = _parse(
+        _read_blocks(file_route, index, blocks),
+        list(range(start - base, stop - base)),
+    )
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+def read_row_sample(
+    file_route: str, index: np.ndarray, row_count: int, size: int, seed: int
+) -> pd.DataFrame:
+    """
+    Reads a random sample of size rows, the same seed always gives the same rows. Only the blocks
+    that contain a sampled row are read. The DataFrame index is the row number in the file.
+    """
+    rng = np.random.default_rng(seed)
+    rows = np.sort(rng.choice(row_count, size=min(size, row_count), replace=False))
+
+    blocks = np.unique(rows // ROW_INDEX_STEP)
+
+    # every block has ROW_INDEX_STEP rows except the last one of the file, which is also the last one read
+    block_position = {int(block): i for i, block in enumerate(blocks)}
+    positions = [
+        block_position[int(row) // ROW_INDEX_STEP] * ROW_INDEX_STEP
+        + int(row) % ROW_INDEX_STEP
+        for row in rows
+    ]
+
+    df = _parse(_read_blocks(file_route, index, blocks.tolist()), positions)
+    df.index = rows
+    return df
@@ -0,0 +1,48 @@
+import datetime
+import unittest
+
+from access_stats import AccessStats
+
+
+class FakeDatabaseHandler:
+    def __init__(self) -> None:
+        self.saved: list[dict[int, tuple[int, datetime.datetime]]] = []
+        self.fail: bool = False
+
+    def record_accesses(self, accesses: dict[int, tuple[int, datetime.datetime]]):
+        if self.fail:
+            raise RuntimeError("database is locked")
+        self.saved.append(accesses)
+
+
+class AccessStatsTest(unittest.TestCase):
+    def test_flush_writes_the_counts_at_once(self):
+        db_handler = FakeDatabaseHandler()
+        stats = AccessStats(db_handler)  # pyright: ignore[reportArgumentType]
+
+        for dataset_id in (1, 2, 1, 1):
+            stats.record(dataset_id)
+        stats.flush()
+        stats.flush()
+
+        self.assertEqual(len(db_handler.saved), 1)
+        counts = {id: count for id, (count, _) in db_handler.saved[0].items()}
+        self.assertEqual(counts, {1: 3, 2: 1})
+
+    def test_failed_flush_keeps_the_counts(self):
+        db_handler = FakeDatabaseHandler()
+        stats = AccessStats(db_handler)  # pyright: ignore[reportArgumentType]
+
+        stats.record(1)
+        db_handler.fail = True
+        with self.assertLogs(level="ERROR"):
+            stats.flush()
+        stats.record(1)
+        db_handler.fail = False
+        stats.flush()
+
+        self.assertEqual(db_handler.saved[0][1][0], 2)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
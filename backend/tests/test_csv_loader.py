@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from csv_loader import infer_schema, optimize_dtypes, read_csv
+
+
+class ReadCsvTest(unittest.TestCase):
+    def write_csv(self, content: str) -> str:
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w") as f:
+            _ = f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def assert_matches_pandas(self, content: str):
+        path = self.write_csv(content)
+        pd.testing.assert_frame_equal(read_csv(path), pd.read_csv(path))
+
+    def test_renames_duplicated_columns(self):
+        self.assert_matches_pandas("a,a,b,a.1,\n1,2,x,4,5\n3,4,y,6,7\n")
+
+    def test_missing_values(self):
+        self.assert_matches_pandas(
+            "text,number,empty\n"
+            + "x,1,\nNA,NA,\nnull,2,\nn/a,3,\n,4,\nNone,<NA>,\ny,5,\n"
+        )
+
+    def test_duplicated_columns_can_be_optimized(self):
+        path = self.write_csv("a,a,b\n1,2,x\n3,4,y\n")
+
+        df = optimize_dtypes(read_csv(path))
+
+        self.assertEqual(df.columns.tolist(), ["a", "a.1", "b"])
+        self.assertEqual(df["a.1"].tolist(), [2, 4])
+
+    def test_schema_gives_the_optimized_dtypes(self):
+        path = self.write_csv(
+            "small,big,ratio,name,kind,flag\n"
+            + "".join(
+                f"{i},{i * 10**6},{i / 4},name {i},{'ab'[i % 2]},{i % 2 == 0}\n"
+                for i in range(20)
+            )
+            + "1,2,0.5,NA,,True\n"
+        )
+        optimized = optimize_dtypes(read_csv(path))
+
+        df = read_csv(path, schema=infer_schema(optimized))
+
+        pd.testing.assert_frame_equal(df, optimized)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+import numpy as np
+
+from distribution import compute_distribution
+
+
+class ComputeDistributionTest(unittest.TestCase):
+    def test_matches_numpy_histogram_across_chunks(self):
+        values = np.random.default_rng(0).normal(size=1000)
+        chunks = np.array_split(values, 7)
+
+        result = compute_distribution(lambda: chunks, 12)
+
+        counts, edges = np.histogram(values, bins=12)
+        self.assertEqual(result["counts"], counts.tolist())
+        np.testing.assert_allclose(result["bin_edges"], edges)
+
+    def test_ignores_nan_and_infinities(self):
+        values = np.array([1.0, 2.0, np.nan, np.inf, -np.inf, 3.0])
+
+        result = compute_distribution(lambda: [values], 2)
+
+        self.assertEqual(result["bin_edges"], [1.0, 2.0, 3.0])
+        self.assertEqual(result["counts"], [1, 2])
+        self.assertTrue(np.isfinite(result["kde_y"]).all())
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import row_index
+
+
+class RowIndexTest(unittest.TestCase):
+    """
+    build_row_index has to count the same rows as the pandas parser, otherwise PreviewDataset
+    returns the wrong pages and total_rows.
+    """
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def write_csv(self, text: str) -> str:
+        path = os.path.join(self.dir.name, "data.csv")
+        with open(path, "w", newline="") as f:
+            _ = f.write(text)
+        return path
+
+    def assert_matches_pandas(self, path: str):
+        expected = pd.read_csv(path, skip_blank_lines=False)
+
+        row_count = row_index.build_row_index(path)
+        self.assertEqual(row_count, len(expected))
+
+        index = row_index.load_row_index(row_index.row_index_route(path))
+        rows = row_index.read_row_range(path, index, 0, row_count)
+        self.assertEqual(rows.values.tolist(), expected.values.tolist())
+
+    def test_quote_inside_unquoted_field(self):
+        # the quote is part of the value, it doesn't open a quoted field
+        path = self.write_csv('a,b\n5" tv,1\n2,2\n3,3\n')
+        self.assert_matches_pandas(path)
+
+    def test_quoted_newlines_across_chunks(self):
+        path = self.write_csv(
+            'a,b\n"first\nline",1\n"say ""hi""\n,ok",2\n"""",3\n'
+            '12" pipe,4\n"",5\n"a\n\n",6'
+        )
+        size = os.path.getsize(path)
+
+        # every chunk size splits the quoted fields and the runs of quotes somewhere else
+        for chunk_size in range(1, size + 1):
+            with self.subTest(chunk_size=chunk_size):
+                with mock.patch.object(row_index, "SCAN_CHUNK_SIZE", chunk_size):
+                    self.assert_matches_pandas(path)
+
+    def test_pages_across_index_blocks(self):
+        rows = row_index.ROW_INDEX_STEP * 2 + 10
+        path = self.write_csv(
+            "a,b\n" + "".join(f'{i},"row\n{i}"\n' for i in range(rows))
+        )
+        self.assertEqual(row_index.build_row_index(path), rows)
+
+        index = row_index.load_row_index(row_index.row_index_route(path))
+        start = row_index.ROW_INDEX_STEP - 5
+        page = row_index.read_row_range(path, index, start, start + 20)
+        self.assertEqual(page["a"].tolist(), list(range(start, start + 20)))
+        self.assertEqual(page.index.tolist(), list(range(start, start + 20)))
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,92 @@
+import importlib.util
+import logging
+import os
+import sys
+import threading
+from collections.abc import Callable
+from types import ModuleType
+
+# how many of the most used datasets are loaded into memory at startup
+WARM_UP_DATASETS = int(os.environ.get("AIDS_WARMUP_DATASETS", "5"))
+
+# memory the datasets loaded at startup can use, in MB
+WARM_UP_MEMORY_MB = int(os.environ.get("AIDS_WARMUP_MEMORY_MB", "512"))
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Imports a module without running it, it runs the first time one of its attributes is used.
+
+    The analysis modules (charts, csv_loader, distribution, row_index) import pandas, pyarrow,
+    matplotlib and seaborn at the top, which takes seconds. api.py imports them with this so the
+    server can start right away, and warm_up_analysis_libraries loads them in the background.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def warm_up_analysis_libraries() -> None:
+    """
+    Loads the analysis modules (and with them pandas, pyarrow, matplotlib and seaborn) and
+    initializes them, so the first request that needs them doesn't pay for it.
+
+    Forces the headless Agg backend and builds the matplotlib font cache by rendering a small chart.
+    """
+    import matplotlib
+
+    # headless server, no display. has to be set before importing pyplot
+    matplotlib.use("Agg")
+
+    import pandas as pd
+    from matplotlib import font_manager
+
+    import aids_pb2
+    import charts
+    import csv_loader  # noqa: F401 # pyright: ignore[reportUnusedImport]
+    import distribution  # noqa: F401 # pyright: ignore[reportUnusedImport]
+    import row_index  # noqa: F401 # pyright: ignore[reportUnusedImport]
+
+    # loads (or builds, on the first start) the font cache and resolves the default font
+    _ = font_manager.findfont(font_manager.FontProperties())
+
+    # render a tiny chart so the svg backend and seaborn theme are initialized too
+    df = pd.DataFrame({"x": [0, 1], "y": [0, 1]})
+    _ = charts.render_chart(
+        lambda ax: charts.draw_scatter(ax, df, "x", "y"), aids_pb2.SVG, 0, 0, 0
+    )
+
+
+def start_warm_up(
+    steps: list[Callable[[], None]], on_ready: Callable[[], None]
+) -> threading.Thread:
+    """
+    Runs the warm-up steps in order in a background thread and calls on_ready once they're done.
+    A failed step is logged and skipped, whatever it was warming up just gets loaded on the first
+    request instead.
+    """
+
+    def run() -> None:
+        logging.info("Warm-up started")
+        for step in steps:
+            try:
+                step()
+            except Exception as e:
+                logging.error(f"Warm-up step {step.__name__} failed with error: {e}")
+
+        logging.info("Warm-up finished")
+        on_ready()
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread